@@ -0,0 +1,82 @@
+"""Bytes and time for the /data table reads, projected against SELECT *.
+
+    cd backend && python benchmarks/column_projection.py [--repeat 20]
+    cd backend && python benchmarks/column_projection.py --database-url postgresql://...
+
+Without --database-url the tables are loaded from data/data.json into a
+temporary SQLite file, the way the pipeline writes them. "Bytes" is the JSON
+encoding of the fetched values, a driver-neutral proxy for what crosses the
+wire; against Postgres the timings include the real network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def sqlite_from_archive(directory: str):
+    archive = json.loads(main.DATA_FILE.read_text())
+    engine = create_engine(f"sqlite:///{Path(directory) / 'climate.db'}")
+    for key, (table, _) in main._DATA_TABLES.items():
+        pd.DataFrame(archive[key]).to_sql(table, engine, index=False)
+    return engine
+
+
+def measure(engine, projected: bool, repeat: int) -> tuple[dict[str, int], list[float]]:
+    with engine.connect() as conn:
+        def read(table, columns):
+            sql = main._select_sql(conn, table, columns if projected else None)
+            return [dict(row._mapping) for row in conn.exec_driver_sql(sql)]
+
+        sizes = {
+            table: len(json.dumps(read(table, columns), default=str))
+            for table, columns in main._DATA_TABLES.values()
+        }
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for table, columns in main._DATA_TABLES.values():
+                read(table, columns)
+            runs.append((time.perf_counter() - start) * 1000)
+    return sizes, runs
+
+
+def run(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = (
+            create_engine(args.database_url) if args.database_url else sqlite_from_archive(tmp)
+        )
+        whole, whole_runs = measure(engine, False, args.repeat)
+        projected, projected_runs = measure(engine, True, args.repeat)
+        engine.dispose()
+
+    print(f"{'table':<16}{'SELECT *':>12}{'projected':>12}")
+    for table in whole:
+        print(f"{table:<16}{whole[table]:>12,}{projected[table]:>12,}")
+    total_whole, total_projected = sum(whole.values()), sum(projected.values())
+    print(f"{'total bytes':<16}{total_whole:>12,}{total_projected:>12,}"
+          f"   ({total_projected / total_whole:.0%})")
+    print(f"{'median ms':<16}{statistics.median(whole_runs):>12.1f}"
+          f"{statistics.median(projected_runs):>12.1f}")
+
+
+if __name__ == "__main__":
+    run()
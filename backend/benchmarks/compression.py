@@ -0,0 +1,73 @@
+"""CPU per request and bytes on the wire for /data, by Content-Encoding.
+
+    cd backend && python benchmarks/compression.py [--repeat 50]
+
+Serves /data from data/data.json through the app with a warm payload cache and
+compares three ways of answering:
+
+  identity       the cached body as it is, as before
+  per request    compressing the cached body on every request, what a
+                 compression middleware in front of the app would do
+  precompressed  the body compressed once and kept on the cache entry
+
+CPU is process time for the whole request through the test client, which
+reads the raw bytes without decoding them, so the identity row is the floor
+the other two add to.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def fetch(client: TestClient, headers: dict[str, str], before=None) -> tuple[float, int]:
+    """CPU ms and bytes on the wire for one /data request."""
+    start = time.process_time()
+    if before is not None:
+        before()
+    with client.stream("GET", "/data", headers=headers) as response:
+        wire = sum(len(chunk) for chunk in response.iter_raw())
+    return (time.process_time() - start) * 1000, wire
+
+
+def cpu_ms(client: TestClient, headers: dict[str, str], repeat: int, before=None):
+    runs = [fetch(client, headers, before) for _ in range(repeat)]
+    return statistics.median(ms for ms, _ in runs), runs[-1][1]
+
+
+def run(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    main._resolved_database_url = lambda: None
+    client = TestClient(main.app)
+    client.get("/data")
+
+    rows = [("identity", "-", *cpu_ms(client, {"Accept-Encoding": "identity"}, args.repeat))]
+    for encoding in main._ENCODINGS:
+        headers = {"Accept-Encoding": encoding}
+        entry = main._PAYLOAD_CACHE["/data", "records"]
+        # per request: forget the compressed body before every request
+        rows.append((encoding, "per request",
+                     *cpu_ms(client, headers, args.repeat, before=entry.encoded.clear)))
+        client.get("/data", headers=headers)
+        rows.append((encoding, "precompressed", *cpu_ms(client, headers, args.repeat)))
+
+    print(f"{'encoding':<10}{'compressed':<16}{'CPU ms/request':>16}{'bytes on wire':>16}")
+    for encoding, mode, ms, wire in rows:
+        print(f"{encoding:<10}{mode:<16}{ms:>16.2f}{wire:>16,}")
+
+
+if __name__ == "__main__":
+    run()
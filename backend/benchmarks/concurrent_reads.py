@@ -0,0 +1,79 @@
+"""Latency of /data's uncached table reads, one by one against concurrent.
+
+    cd backend && python benchmarks/concurrent_reads.py [--repeat 10]
+    cd backend && python benchmarks/concurrent_reads.py --database-url postgresql://...
+
+Without --database-url the tables are loaded from data/data.json into a
+temporary SQLite file, which has no network at all; --latency-ms then holds
+every statement for that long, standing in for the round trip to a hosted
+Postgres. Against a real database leave it at 0.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+
+sys.path[:0] = [str(Path(__file__).resolve().parent)]
+
+from column_projection import sqlite_from_archive  # noqa: E402
+import main  # noqa: E402
+
+
+def measure(engine, concurrency: int, repeat: int) -> list[float]:
+    main.settings.db_read_concurrency = concurrency
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        main._read_data(engine)
+        runs.append((time.perf_counter() - start) * 1000)
+    return runs
+
+
+def run(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--latency-ms", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+    latency = args.latency_ms if args.latency_ms is not None else (0 if args.database_url else 20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url:
+            engine = create_engine(args.database_url, **main._engine_options(args.database_url))
+        else:
+            engine = sqlite_from_archive(tmp)
+        if latency:
+            event.listen(
+                engine, "before_cursor_execute", lambda *_: time.sleep(latency / 1000)
+            )
+        main._read_data(engine)  # warm the pool
+        print(f"{len(main._data_reads(None))} reads, {latency:g} ms added per statement")
+        slowest = {}
+        for key, read in main._data_reads(None).items():
+            runs = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                with main._db_connect(engine) as conn:
+                    read(conn)
+                runs.append((time.perf_counter() - start) * 1000)
+            slowest[key] = statistics.median(runs)
+        key = max(slowest, key=slowest.get)
+        print(f"slowest single read: {key}, {slowest[key]:.1f} ms; "
+              f"sum of all: {sum(slowest.values()):.1f} ms")
+        print(f"{'concurrency':<14}{'median ms':>12}")
+        for concurrency in (1, 2, 4, 7):
+            runs = measure(engine, concurrency, args.repeat)
+            print(f"{concurrency:<14}{statistics.median(runs):>12.1f}")
+            main._shutdown_read_executor()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
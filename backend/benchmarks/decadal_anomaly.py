@@ -0,0 +1,61 @@
+"""Time compute_decadal_daily_anomaly against the pandas version it replaced.
+
+    cd backend && python benchmarks/decadal_anomaly.py [--repeat 20]
+
+Both run on the daily series in data/data.json with the configured seaice_*
+settings. The pandas version is the reference kept in
+tests/test_decadal_anomaly.py, which also checks the two agree exactly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(BACKEND), str(BACKEND / "tests")]
+
+import main  # noqa: E402
+from test_decadal_anomaly import reference_decadal_anomaly  # noqa: E402
+
+
+def timed(fn, repeat: int) -> list[float]:
+    fn()  # warm up
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return runs
+
+
+def run(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rows = json.loads(main.DATA_FILE.read_text())["dailySeaIce"]
+    settings = main.settings
+    same = json.dumps(reference_decadal_anomaly(rows, settings)) == json.dumps(
+        main.compute_decadal_daily_anomaly(rows)
+    )
+    if not same:
+        sys.exit("outputs differ; run tests/test_decadal_anomaly.py")
+
+    print(f"{len(rows)} daily rows, {args.repeat} runs each (ms)")
+    results = {
+        "pandas (previous)": timed(lambda: reference_decadal_anomaly(rows, settings), args.repeat),
+        "numpy": timed(lambda: main.compute_decadal_daily_anomaly(rows), args.repeat),
+    }
+    for name, runs in results.items():
+        print(f"  {name:<18} median {statistics.median(runs):7.1f}   min {min(runs):7.1f}")
+    ratio = statistics.median(results["pandas (previous)"]) / statistics.median(results["numpy"])
+    print(f"  speed-up {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
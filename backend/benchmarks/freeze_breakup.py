@@ -0,0 +1,64 @@
+"""Time _freeze_and_breakup_all against the season-by-season definition it replaced.
+
+    cd backend && python benchmarks/freeze_breakup.py [--repeat 10] [--seasons 10 1000]
+
+Seasons are synthetic, drawn like the random ones in
+tests/test_freeze_breakup_all.py, which checks the two agree: up to 140 days each,
+blocks of ice and open water, some values missing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(BACKEND), str(BACKEND / "tests")]
+
+import main  # noqa: E402
+from test_freeze_breakup_all import per_season, random_season  # noqa: E402
+
+
+def timed(fn, repeat: int) -> list[float]:
+    fn()  # warm up
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return runs
+
+
+def run(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seasons", type=int, nargs="+", default=[10, 1000])
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    for count in args.seasons:
+        rows = pd.concat([random_season(rng, 1000 + y) for y in range(count)], ignore_index=True)
+        if main._freeze_and_breakup_all(rows) != per_season(rows):
+            sys.exit("outputs differ; run tests/test_freeze_breakup_all.py")
+
+        print(f"{count} seasons, {len(rows)} daily rows, {args.repeat} runs each (ms)")
+        results = {
+            "per season (previous)": timed(lambda: per_season(rows), args.repeat),
+            "all at once": timed(lambda: main._freeze_and_breakup_all(rows), args.repeat),
+        }
+        for name, runs in results.items():
+            print(f"  {name:<22} median {statistics.median(runs):8.1f}   min {min(runs):8.1f}")
+        ratio = statistics.median(results["per season (previous)"]) / statistics.median(
+            results["all at once"]
+        )
+        print(f"  speed-up {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,98 @@
+"""CPU to serialise the /data and /uummannaq payloads, per request and per build.
+
+    cd backend && python benchmarks/serialization.py [--repeat 20]
+
+Payloads are built from the local files (data/data.json, and the fjord JSON or
+CSV fallback). For each route:
+
+  response_model   what FastAPI does with a returned dict on every request:
+                   validate against the model, dump, json.dumps
+  build, json      the same work done once per data version, as before
+  build, orjson    the build as it is now, rendered with orjson
+  request          a whole request through the app after a first one, served
+                   from the payload cache where the route caches that source
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from schemas import FjordDataBundle  # noqa: E402
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # warm up
+    runs = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        runs.append((time.process_time() - start) * 1000)
+    return statistics.median(runs)
+
+
+def stdlib_json(content) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def data_payload() -> dict:
+    data = main._read_json(main.DATA_FILE)
+    data["decadalAnomaly"] = main.compute_decadal_daily_anomaly(data["dailySeaIce"])
+    return main._slim_data_payload(main._attach_data_meta(data))
+
+
+def fjord_payload() -> dict:
+    if main.FJORD_DATA_FILE.exists():
+        return main._attach_fjord_meta(main._read_json(main.FJORD_DATA_FILE))
+    return main._build_fjord_payload_from_csv()
+
+
+def run(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    main._resolved_database_url = lambda: None
+    client = TestClient(main.app)
+    headers = {"Accept-Encoding": "identity"}
+
+    print(f"{'route':<12}{'path':<18}{'CPU ms':>10}")
+    for route, model, build in (
+        ("/data", main.DataResponse, data_payload),
+        ("/uummannaq", FjordDataBundle, fjord_payload),
+    ):
+        payload = build()
+        if payload is None:
+            print(f"{route:<12}no local data, skipped")
+            continue
+        rows = {
+            "response_model": timed(
+                lambda: stdlib_json(model.model_validate(payload).model_dump(mode="json")),
+                args.repeat,
+            ),
+            "build, json": timed(
+                lambda: stdlib_json(main._payload_content(model, payload)), args.repeat
+            ),
+            "build, orjson": timed(
+                lambda: main._render_json(main._payload_content(model, payload)), args.repeat
+            ),
+        }
+        client.get(route, headers=headers)
+        rows["request"] = timed(lambda: client.get(route, headers=headers), args.repeat)
+        for name, ms in rows.items():
+            print(f"{route:<12}{name:<18}{ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    run()
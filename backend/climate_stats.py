@@ -0,0 +1,473 @@
+"""Statistics the API and the data pipeline both compute, defined once.
+
+The pipeline precomputes the decadal anomaly, the per-season sampling errors
+and the fjord season band, and stores them, stamped with the parameters they
+were computed with where the API's may differ. The API serves a stored copy
+only when that stamp equals its own, and computes it itself otherwise: for the
+file fallbacks, or a pipeline configured differently. Both import the
+functions from here, so the two answers cannot drift apart. A change of
+algorithm bumps the revision in its fingerprint, and the API then recomputes
+until the next pipeline run.
+
+backend/climate_stats.py is the original. data-pipeline/climate_stats.py is a
+byte for byte copy, since each service's image is built from its own directory;
+backend/tests/test_climate_stats_copy.py fails when the two differ, so edit
+here and copy it over. NumPy and pandas only: it runs in both images.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+
+# ── Decadal daily anomaly ────────────────────────────────────────────────────
+# Everything below works on NumPy arrays rather than a DataFrame. The old
+# version ran a Python lambda per year, formatted every date as a string to
+# find its 365-day calendar slot, pivoted, and smoothed one decade at a time
+# through pandas; on the full record that was most of the cost of a cold /data.
+# The steps and their order are unchanged, so the output is too:
+#
+#   1. calendar   leap day dropped and later days shifted by index arithmetic
+#   2. pre-smooth centred moving mean per year, over that year's observations
+#                 in order (not calendar days: before 1988 NSIDC reports every
+#                 other day and the window has always spanned observations)
+#   3. baseline   per-day mean of the smoothed extent over the baseline years
+#   4. decades    mean, SD and N of the anomaly per decade and day, on a dense
+#                 year x day array
+#   5. smoothing  gaps interpolated, then one circular Hamming convolution
+#                 across all decades at once
+#
+# "Unchanged" means bit for bit, which is why the sums in 2-4 are accumulated
+# in pandas' order rather than with cumsum differences; see _centred_mean.
+# tests/test_decadal_anomaly.py compares against the old code record by record
+# and benchmarks/decadal_anomaly.py times the two.
+_DAILY_COLUMNS = {
+    'year': ('Year', 'year'),
+    'doy': ('DayOfYear', 'doy', 'dayofyear'),
+    'extent': ('Extent', 'extent', 'value'),
+}
+
+
+def _daily_column(daily_rows: List[dict], name: str) -> np.ndarray:
+    # toleriert unterschiedliche Groß/Kleinschreibung / Namen; the rows come
+    # from one table or one JSON list, so the first row's keys are everyone's
+    columns = daily_rows[0].keys()
+    colmap = {c.lower(): c for c in columns}
+    for cand in _DAILY_COLUMNS[name]:
+        key = cand if cand in columns else colmap.get(cand.lower())
+        if key is not None:
+            break
+    else:
+        raise KeyError(_DAILY_COLUMNS[name][0])
+    values = np.array([row.get(key) for row in daily_rows], dtype=object)
+    try:
+        return values.astype('float64')
+    except (TypeError, ValueError):
+        # unparseable values count as missing, as pd.to_numeric(errors='coerce') did
+        return np.array([_parse_float(v) for v in values], dtype='float64')
+
+
+def _parse_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _calendar_day(year: np.ndarray, doy: np.ndarray) -> np.ndarray:
+    """Day on a 365-day calendar, 0 for 29 February."""
+    # via datetime64 so a day-of-year past the year's end lands on the next
+    # year's date, as the old date round trip did
+    dates = (year - 1970).astype('datetime64[Y]').astype('datetime64[D]') + (doy - 1)
+    start = dates.astype('datetime64[Y]')
+    day = (dates - start.astype('datetime64[D]')).astype(np.int64) + 1
+    y = start.astype(np.int64) + 1970
+    leap = (y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0))
+    return np.where(leap & (day == 60), 0, day - (leap & (day > 60)))
+
+
+def _centred_mean(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Row-wise ``rolling(window, center=True, min_periods).mean()``.
+
+    The window sum is a running total, the cumulative sum less what has left
+    the window, carried for every row at once. It is accumulated exactly as
+    pandas does (Kahan-compensated adds and removes, a run of equal values
+    returned as that value): a plain cumsum difference is off in the last
+    bits, and since the extents have three decimals the anomaly then lands on
+    the 0.0005 rounding boundary often enough to flip published values.
+    """
+    rows, width = values.shape
+    offset = (window - 1) // 2
+    ends = np.arange(1 + offset, width + 1 + offset)
+    starts = np.clip(ends - window, 0, width)
+    ends = np.clip(ends, 0, width)
+
+    nobs = np.zeros(rows, dtype=np.int64)
+    neg = np.zeros(rows, dtype=np.int64)
+    same = np.zeros(rows, dtype=np.int64)
+    total = np.zeros(rows)
+    comp_add = np.zeros(rows)
+    comp_remove = np.zeros(rows)
+    prev = np.full(rows, np.nan)
+
+    def add(val):
+        nonlocal total, comp_add, prev
+        ok = ~np.isnan(val)
+        y = val - comp_add
+        t = total + y
+        comp_add = np.where(ok, t - total - y, comp_add)
+        total = np.where(ok, t, total)
+        nobs[ok] += 1
+        neg[ok & np.signbit(val)] += 1
+        np.copyto(same, np.where(val == prev, same + 1, 1), where=ok)
+        prev = np.where(ok, val, prev)
+
+    def remove(val):
+        nonlocal total, comp_remove
+        ok = ~np.isnan(val)
+        y = -val - comp_remove
+        t = total + y
+        comp_remove = np.where(ok, t - total - y, comp_remove)
+        total = np.where(ok, t, total)
+        nobs[ok] -= 1
+        neg[ok & np.signbit(val)] -= 1
+
+    out = np.full((rows, width), np.nan)
+    for i in range(width):
+        s, e = starts[i], ends[i]
+        if i == 0 or s >= ends[i - 1]:
+            nobs[:] = neg[:] = same[:] = 0
+            total = np.zeros(rows)
+            comp_add = np.zeros(rows)
+            comp_remove = np.zeros(rows)
+            prev = values[:, s].copy() if s < width else np.full(rows, np.nan)
+            for j in range(s, e):
+                add(values[:, j])
+        else:
+            for j in range(starts[i - 1], s):
+                remove(values[:, j])
+            for j in range(ends[i - 1], e):
+                add(values[:, j])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / nobs
+        mean = np.where(same >= nobs, prev,
+                        np.where((neg == 0) & (mean < 0), 0.0,
+                                 np.where((neg == nobs) & (mean > 0), 0.0, mean)))
+        out[:, i] = np.where((nobs >= min_periods) & (nobs > 0), mean, np.nan)
+    return out
+
+
+def _bfill_ffill(values: np.ndarray) -> np.ndarray:
+    """``Series.bfill().ffill()`` for a 1-D array."""
+    n = len(values)
+    pos = np.arange(n)
+    nxt = np.minimum.accumulate(np.where(np.isnan(values), n, pos)[::-1])[::-1]
+    out = np.where(nxt < n, values[np.minimum(nxt, n - 1)], np.nan)
+    prv = np.maximum.accumulate(np.where(np.isnan(out), -1, pos))
+    return np.where(prv >= 0, out[np.maximum(prv, 0)], np.nan)
+
+
+def _group_stats(values: np.ndarray, groups: np.ndarray, n_groups: int) -> tuple:
+    """Per-group column mean, SD (ddof=1) and count over the rows of ``values``.
+
+    Rows are folded in order, the way pandas' groupby does it (Kahan sums for
+    the mean, Welford for the variance), for the reason in ``_centred_mean``.
+    The loop runs over rows, i.e. years; each step covers all 365 days.
+    """
+    cols = values.shape[1]
+    total = np.zeros((n_groups, cols))
+    comp = np.zeros((n_groups, cols))
+    nobs = np.zeros((n_groups, cols), dtype=np.int64)
+    running = np.zeros((n_groups, cols))
+    m2 = np.zeros((n_groups, cols))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for row, g in zip(values, groups):
+            ok = ~np.isnan(row)
+            y = row - comp[g]
+            t = total[g] + y
+            c = t - total[g] - y
+            comp[g] = np.where(ok, np.where(np.isnan(c), 0.0, c), comp[g])
+            total[g] = np.where(ok, t, total[g])
+            nobs[g] += ok
+            old = running[g].copy()
+            running[g] = np.where(ok, old + (row - old) / nobs[g], old)
+            m2[g] = np.where(ok, m2[g] + (row - running[g]) * (row - old), m2[g])
+        mean = np.where(nobs > 0, total / nobs, np.nan)
+        sd = np.where(nobs > 1, np.sqrt(m2 / (nobs - 1)), np.nan)
+    return mean, sd, nobs
+
+
+def _interpolate_rows(y: np.ndarray) -> np.ndarray:
+    """Row-wise ``interpolate(limit_direction='both')``, via np.interp's formula."""
+    rows, days = y.shape
+    valid = ~np.isnan(y)
+    pos = np.arange(days)[None, :]
+    prv = np.maximum.accumulate(np.where(valid, pos, -1), axis=1)
+    nxt = np.minimum.accumulate(np.where(valid, pos, days)[:, ::-1], axis=1)[:, ::-1]
+    row = np.arange(rows)[:, None]
+    y_prv = y[row, np.maximum(prv, 0)]
+    y_nxt = y[row, np.minimum(nxt, days - 1)]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = (y_nxt - y_prv) / (nxt - prv)
+        inner = slope * (pos - prv) + y_prv
+    filled = np.where(prv < 0, y_nxt, np.where(nxt >= days, y_prv, inner))
+    return np.where(valid, y, filled)
+
+
+def _circular_smooth(y: np.ndarray, win: int) -> np.ndarray:
+    """Zyklische Faltung (Wrap-Around) mit Hamming-Fenster, eine Zeile je Dekade."""
+    if win <= 1:
+        return y
+    if win % 2 == 0:  # Fenster muss ungerade sein
+        win += 1
+    k = np.hamming(win)
+    k = k / k.sum()
+    h = win // 2
+    out = y.copy()
+    # Dekaden ganz ohne Werte bleiben unverändert
+    rows = np.isfinite(y).any(axis=1)
+    if not rows.any():
+        return out
+    # fehlende Tage vorher per Interpolation füllen
+    filled = _interpolate_rows(y[rows])
+    # every decade wrapped h days each way and laid end to end: one
+    # np.convolve call, whose full-overlap outputs are the per-decade results
+    ypad = np.concatenate([filled[:, -h:], filled, filled[:, :h]], axis=1)
+    conv = np.convolve(ypad.ravel(), k, mode="same").reshape(ypad.shape)
+    out[rows] = conv[:, h:-h]
+    return out
+
+
+def compute_decadal_daily_anomaly(daily_rows: List[dict], params: dict) -> List[dict]:
+    """Per decade and calendar day: smoothed mean anomaly, SD and N.
+
+    `params` holds the seaice_* settings: yr_min, yr_max, baseline_start,
+    baseline_end, smooth_window and decadal_smooth.
+    """
+    if not daily_rows:
+        return []
+
+    # -------- Konfiguration (ENV überschreibbar) -------------
+    YR_MIN = params['yr_min']
+    YR_MAX = params['yr_max']
+    BASE0  = params['baseline_start']
+    BASE1  = params['baseline_end']
+    W_YEAR = max(1, params['smooth_window'])       # jährl. Vor-Glättung
+    W_DEC  = max(1, params['decadal_smooth'])     # n a c h Dekadenmittel
+
+    # -------- Rohdaten normalisieren --------------------------
+    year = _daily_column(daily_rows, 'year')
+    doy = _daily_column(daily_rows, 'doy')
+    extent = _daily_column(daily_rows, 'extent')
+    keep = ~np.isnan(year) & ~np.isnan(doy) & ~np.isnan(extent)
+    year = year[keep].astype(np.int64)
+    doy = doy[keep].astype(np.int64)
+    extent = extent[keep]
+    keep = (year >= YR_MIN) & (year <= YR_MAX)
+    year, doy, extent = year[keep], doy[keep], extent[keep]
+
+    # 29. Feb entfernen und auf 365-Tage-Kalender mappen
+    day = _calendar_day(year, doy)
+    keep = day > 0
+    year, day, extent = year[keep], day[keep], extent[keep]
+    if not len(year):
+        return []
+
+    order = np.lexsort((day, year))
+    year, day, extent = year[order], day[order], extent[order]
+    years, yi = np.unique(year, return_inverse=True)
+
+    # jährliche Vor-Glättung (zentrierter MA) über die Beobachtungen des Jahres
+    starts = np.searchsorted(year, years)
+    rank = np.arange(len(year)) - starts[yi]
+    by_rank = np.full((len(years), rank.max() + 1), np.nan)
+    by_rank[yi, rank] = extent
+    smooth = _centred_mean(by_rank, W_YEAR, min(W_YEAR, max(2, W_YEAR // 2)))
+    smooth = _bfill_ffill(smooth[yi, rank])
+
+    # dichtes Jahr x Tag-Raster
+    present = np.zeros((len(years), 365), dtype=bool)
+    present[yi, day - 1] = True
+    grid = np.full((len(years), 365), np.nan)
+    grid[yi, day - 1] = smooth
+
+    # Baseline 1981–2010 (oder ENV)
+    in_base = (years >= BASE0) & (years <= BASE1)
+    clim, _, _ = _group_stats(grid[in_base], np.zeros(in_base.sum(), dtype=np.int64), 1)
+
+    # Anomalie und Dekade
+    an = grid - clim[0]
+    decades, di = np.unique((years // 10) * 10, return_inverse=True)
+    labels = np.array([f"{d}s" for d in decades])
+
+    # Tagesmittel je Dekade (+ SD, N)
+    mean, sd, n = _group_stats(an, di, len(decades))
+    exists = np.zeros((len(decades), 365), dtype=bool)
+    np.logical_or.at(exists, di, present)
+
+    # Zyklische Glättung über den Saisonverlauf, alle Dekaden zugleich
+    smoothed = np.round(_circular_smooth(mean, W_DEC), 3)
+
+    # sd und n wieder anheften (praktisch für Unsicherheitsbänder);
+    # ein Tag ohne jede Zeile einer Dekade hat weder sd noch n
+    sd = np.where(exists, np.round(sd, 3), np.nan)
+    counts = n if exists.all() else np.where(exists, n, np.nan)
+
+    days = range(1, 366)
+    records = []
+    for i in np.argsort(labels, kind='stable'):
+        label = str(labels[i])
+        records.extend(
+            {'decade': label, 'day': d, 'an': a, 'sd': s, 'n': c}
+            for d, a, s, c in zip(days, smoothed[i].tolist(), sd[i].tolist(),
+                                  counts[i].tolist())
+        )
+    return records
+
+
+# Part of every stored anomaly's stamp. Bump it when the algorithm below
+# changes, so the API stops serving anomalies computed the old way.
+DECADAL_ANOMALY_REVISION = 1
+
+
+def decadal_anomaly_fingerprint(params: dict) -> str:
+    """Identifies the parameters a decadal anomaly was computed with."""
+    return (
+        f"v{DECADAL_ANOMALY_REVISION};"
+        f"years={params['yr_min']}-{params['yr_max']};"
+        f"baseline={params['baseline_start']}-{params['baseline_end']};"
+        f"smooth={params['smooth_window']};"
+        f"decadal={params['decadal_smooth']}"
+    )
+
+
+# ── Fjord season statistics ──────────────────────────────────────────────────
+# How many resamples back the per-season sampling error. 2000 is well past the
+# point where the estimate stops moving and still costs milliseconds.
+SEASON_BOOTSTRAP_DRAWS = 2000
+# Part of every stored sampling error's stamp; bump it with the algorithm.
+SAMPLING_ERROR_REVISION = 1
+
+
+def sampling_error_fingerprint(window: tuple[int, int]) -> str:
+    """Identifies how sampling errors over the day-of-year `window` were computed."""
+    return (
+        f"v{SAMPLING_ERROR_REVISION};"
+        f"draws={SEASON_BOOTSTRAP_DRAWS};"
+        f"window={window[0]}-{window[1]}"
+    )
+
+
+def measured_days(season_rows: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """(year, value) of every measured day, grouped by year in original order.
+
+    Only days with an actual observation count: frac_raw where the rows have
+    it, since gap-filled days carry no independent information.
+    """
+    measured_column = "frac_raw" if "frac_raw" in season_rows.columns else "frac"
+    measured = pd.DataFrame({
+        "year": pd.to_numeric(season_rows["year"], errors="coerce"),
+        "value": pd.to_numeric(season_rows[measured_column], errors="coerce"),
+    }).dropna()
+    measured = measured.sort_values("year", kind="stable")
+    return measured["year"].to_numpy(np.int64), measured["value"].to_numpy(float)
+
+
+def bootstrap_sampling_errors(
+    season_years: np.ndarray, values: np.ndarray, years
+) -> dict[int, dict[str, Any]]:
+    """Bootstrap spread of each season's measured mean, per year in `years`.
+
+    backend/tests/test_sampling_errors.py keeps the definition, one season per
+    call; this answers for every year at once and exactly as it does. Every
+    season draws its resample indices from a generator seeded with its year
+    (what Generator.choice does underneath), so no season's interval depends
+    on which others are present, and the means of all seasons' resamples are
+    summarised together, standard error and percentiles as one call over a
+    seasons x draws array.
+    """
+    wanted = sorted({int(year) for year in years})
+    starts = np.searchsorted(season_years, wanted, side="left")
+    ends = np.searchsorted(season_years, wanted, side="right")
+    errors: dict[int, dict[str, Any]] = {}
+    bootstrapped: list[int] = []
+    means = []
+    for year, start, end in zip(wanted, starts, ends):
+        observed = int(end - start)
+        if observed < 3:
+            errors[year] = {"observedDays": observed, "standardError": None, "ci95": None}
+            continue
+        sample = values[start:end]
+        picks = np.random.default_rng(seed=year).integers(
+            0, observed, size=(SEASON_BOOTSTRAP_DRAWS, observed)
+        )
+        means.append(sample[picks].mean(axis=1))
+        errors[year] = {"observedDays": observed, "measuredMean": round(float(sample.mean()), 4)}
+        bootstrapped.append(year)
+
+    if bootstrapped:
+        means = np.vstack(means)
+        standard_errors = means.std(axis=1, ddof=1)
+        low, high = np.percentile(means, [2.5, 97.5], axis=1)
+        for i, year in enumerate(bootstrapped):
+            errors[year]["standardError"] = round(float(standard_errors[i]), 4)
+            errors[year]["ci95"] = [round(float(low[i]), 4), round(float(high[i]), 4)]
+    return errors
+
+
+def season_sampling_errors(season_rows: pd.DataFrame, years) -> dict[int, dict[str, Any]]:
+    """bootstrap_sampling_errors over the measured days of `season_rows`."""
+    return bootstrap_sampling_errors(*measured_days(season_rows), years)
+
+
+def season_band(
+    rows: pd.DataFrame, early_years, late_years, window: tuple[int, int]
+) -> pd.DataFrame:
+    """Mean, p25 and p75 of `frac` per day of `window` and period.
+
+    One row per (doy, period) of the window, early before late; a pair
+    without a measured value is NaN. This used to filter the whole record
+    twice per day, 256 scans each with its own quantile calls. The values of
+    each (doy, period) are now laid out left aligned in year order, padded
+    with NaN, so each statistic is one reduction over the rows and sums
+    exactly what the per-day filter summed, in its order.
+    tests/test_fjord_season_band.py holds the two equal.
+    """
+    first, last = window
+    period = pd.Series(None, index=rows.index, dtype=object)
+    period[rows["year"].isin(early_years)] = "early"
+    period[rows["year"].isin(late_years)] = "late"
+    measured = pd.DataFrame({
+        "doy": rows["doy"],
+        "period": period,
+        "year": rows["year"],
+        "frac": pd.to_numeric(rows["frac"], errors="coerce"),
+    })
+    measured = measured[
+        measured["period"].notna()
+        & measured["frac"].notna()
+        & measured["doy"].between(first, last)
+    ].sort_values(["doy", "period", "year"], kind="stable")
+    grid = pd.MultiIndex.from_product(
+        [range(first, last + 1), ["early", "late"]], names=["doy", "period"]
+    )
+    if measured.empty:
+        empty = pd.DataFrame(np.nan, index=grid, columns=["mean", "p25", "p75"])
+        return empty.reset_index()
+
+    measured["position"] = measured.groupby(["doy", "period"]).cumcount()
+    by_day = measured.pivot(index=["doy", "period"], columns="position", values="frac")
+    values = by_day.to_numpy(dtype=float)
+    # every row holds at least one value; the padding is what nan* skips
+    stats = pd.DataFrame(
+        {
+            "mean": np.nanmean(values, axis=1),
+            "p25": np.nanquantile(values, 0.25, axis=1),
+            "p75": np.nanquantile(values, 0.75, axis=1),
+        },
+        index=by_day.index,
+    )
+    return stats.reindex(grid).reset_index()
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, create_model
+from typing import Any, Dict, List, Literal, Optional
 
 
 class SourceFreshness(BaseModel):
@@ -85,4 +85,98 @@ class FjordDataBundle(BaseModel):
     freeze: List[FjordFreezeBreakup]
     daily:  List[FjordDailyRow]
     seasonLossPct: Optional[float] = None   # optionales Zusatzfeld
+    dailyDownsampledFrom: Optional[int] = None  # days in the series, when max_points thinned it
     meta: Optional[FjordDataMeta] = None
+
+
+class SeaIceDailyRow(BaseModel):
+    Year: int
+    DayOfYear: int                            # 1-366, 29 Feb included
+    Extent: Optional[float]                   # million km²
+
+
+class SeaIceDailyRange(BaseModel):
+    """GET /data/daily: the rows of the daily record that match the query."""
+    dailySeaIce: List[SeaIceDailyRow]
+    count: int
+    downsampledFrom: Optional[int] = None     # rows matched, when max_points thinned them
+
+
+# ── Columnar variants (?format=columnar) ──────────────────────────────────────
+# The same payloads with every list of rows sent as one array per column, so a
+# key name is written once per series rather than once per row. Row i of a
+# section is the i-th entry of each of its arrays; column names are the row
+# format's field names. Sections that are not row lists (meta, seasonLossPct)
+# are unchanged. An empty section is {}.
+
+Columns = Dict[str, List[Any]]
+
+
+class SeaIceDailyColumns(BaseModel):
+    Year: List[int] = []
+    DayOfYear: List[int] = []
+    Extent: List[Optional[float]] = []
+
+
+class DecadalAnomalyColumns(BaseModel):
+    decade: List[str] = []                    # "1980s"
+    day: List[int] = []                       # 1-365, 29 Feb removed
+    an: List[Optional[float]] = []
+    sd: List[Optional[float]] = []
+    n: List[Optional[int]] = []
+
+
+class DataColumnar(BaseModel):
+    format: Literal["columnar"] = "columnar"
+    annual: Columns
+    dailySeaIce: SeaIceDailyColumns
+    annualAnomaly: Columns
+    corrMatrix: Columns
+    iqrStats: Columns
+    partial2025: Columns
+    latestSeaIceSeason: Optional[Columns] = None
+    decadalAnomaly: Optional[DecadalAnomalyColumns] = None
+    meta: Optional[Dict[str, Any]] = None
+
+
+def selection_model(model: type[BaseModel]) -> type[BaseModel]:
+    """`model` for a /data?fields= subset: every required section optional.
+
+    The full payload keeps its strict model; a selection is validated against
+    this one, and the sections it leaves out are absent from the dump.
+    """
+    fields = {
+        name: (Optional[info.annotation], None) if info.is_required() else (info.annotation, info)
+        for name, info in model.model_fields.items()
+    }
+    return create_model(f"{model.__name__}Selection", **fields)
+
+
+DataColumnarSelection = selection_model(DataColumnar)
+
+
+class FjordDailyColumns(BaseModel):
+    date: List[str] = []
+    year: List[int] = []
+    doy: List[int] = []
+    frac: List[Optional[float]] = []
+    fracRaw: List[Optional[float]] = []
+
+
+class FjordDataColumnar(BaseModel):
+    format: Literal["columnar"] = "columnar"
+    spring: Columns
+    season: Columns
+    frac: Columns
+    freeze: Columns
+    daily: FjordDailyColumns
+    seasonLossPct: Optional[float] = None
+    dailyDownsampledFrom: Optional[int] = None
+    meta: Optional[FjordDataMeta] = None
+
+
+class SeaIceDailyRangeColumnar(BaseModel):
+    format: Literal["columnar"] = "columnar"
+    dailySeaIce: SeaIceDailyColumns
+    count: int
+    downsampledFrom: Optional[int] = None
@@ -27,6 +27,39 @@ class Settings(BaseSettings):
     seaice_smooth_window: int = 7
     seaice_decadal_smooth: int = 15
 
+    # One pooled engine per process serves every database route. Sized for a
+    # single small Railway Postgres: pool_size + max_overflow is the most
+    # connections one API replica will ever hold open.
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+    db_pool_timeout_seconds: float = 10.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    # Bounds on a single attempt, so an unreachable or stuck database costs a
+    # request seconds rather than the OS TCP timeout before the JSON fallback.
+    db_connect_timeout_seconds: int = 5
+    db_statement_timeout_ms: int = 15000
+    # Circuit breaker: this many unreachable-database errors in a row stop
+    # every route from trying the database until a probe, one per interval,
+    # gets through again.
+    db_breaker_failure_threshold: int = 3
+    db_breaker_probe_interval_seconds: float = 30.0
+    # How many of /data's table reads run at once, each on its own pooled
+    # connection. Counts against pool_size + max_overflow with the requests.
+    db_read_concurrency: int = 4
+
+    # Stale-while-revalidate for /data and /uummannaq: how long a request waits
+    # on a rebuild before it is answered with the last good payload, and how
+    # old that payload may be. 0 max staleness turns it off.
+    payload_stale_after_seconds: float = 1.0
+    payload_max_stale_seconds: int = 6 * 3600
+
+    # Levels for compressing cached payloads, paid once per data version and
+    # encoding. brotli 11 is a further third smaller than 9 but takes seconds
+    # on /data, on the request that first asks for it.
+    compression_gzip_level: int = 9
+    compression_brotli_quality: int = 9
+
 
 @lru_cache
 def get_settings() -> Settings:
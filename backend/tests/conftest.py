@@ -0,0 +1,52 @@
+import json
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def _closed_circuit_breaker():
+    """Each test starts with a closed breaker, whatever the last one did to it."""
+    main.DB_BREAKER.reset()
+    yield
+    main.DB_BREAKER.reset()
+
+
+@pytest.fixture(autouse=True)
+def _sidecars_in_tmp(tmp_path, monkeypatch):
+    """CSV sidecars go to the test's directory, not backend/data."""
+    monkeypatch.setattr(main, "FJORD_CSV_SIDECAR_DIR", tmp_path / "sidecars")
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """No database configured: every route answers from its fallback files."""
+    monkeypatch.setattr(main, "_resolved_database_url", lambda: None)
+    main._invalidate_payload_cache()
+    yield
+    main._invalidate_payload_cache()
+
+
+@pytest.fixture
+def sqlite_database(tmp_path, monkeypatch):
+    """An empty SQLite database the API reads in place of Postgres."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'climate.db'}")
+    monkeypatch.setattr(main, "_resolved_database_url", lambda: str(engine.url))
+    monkeypatch.setattr(main, "_engine", lambda: engine)
+    main._invalidate_payload_cache()
+    yield engine
+    main._invalidate_payload_cache()
+    engine.dispose()
+
+
+@pytest.fixture
+def database(sqlite_database, monkeypatch):
+    """data.json written into the tables the pipeline fills, one frame each."""
+    archive = json.loads(main.DATA_FILE.read_text())
+    for key, (table, _) in main._DATA_TABLES.items():
+        pd.DataFrame(archive[key]).to_sql(table, sqlite_database, index=False)
+    monkeypatch.setattr(main, "_utc_now_iso", lambda: "2026-01-01T00:00:00Z")
+    return sqlite_database
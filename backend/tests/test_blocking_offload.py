@@ -0,0 +1,115 @@
+"""A slow database read must not stall the other requests.
+
+The data routes are async but their work is blocking. Run on the event loop, one
+slow Postgres read held up every concurrent request, chat streams included.
+This fires a request whose database read takes a full second and checks that a
+second request, issued while the first is stuck, is answered straight away.
+The same holds while a first request compresses a freshly built body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import main
+from main import app
+
+SLOW_QUERY_SECONDS = 1.0
+
+
+@pytest.fixture
+def slow_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "_resolved_database_url", lambda: f"sqlite:///{tmp_path / 'slow.db'}")
+    main._dispose_engine()
+    main._invalidate_payload_cache()
+
+    def slow_version(conn, dataset):
+        time.sleep(SLOW_QUERY_SECONDS)
+        return None
+
+    monkeypatch.setattr(main, "_published_version", slow_version)
+    yield
+    main._dispose_engine()
+    main._invalidate_payload_cache()
+
+
+async def _race(slow_path: str) -> tuple[float, int]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        started = time.perf_counter()
+        slow = asyncio.create_task(client.get(slow_path))
+        # let the slow request reach its database read first; on a blocked
+        # loop this sleep itself does not return until the read is done
+        await asyncio.sleep(0.1)
+        fast = await client.post("/predict", json={"temperature": 1.0, "co2": 2.0})
+        elapsed = time.perf_counter() - started
+        await slow
+    return elapsed, fast.status_code
+
+
+@pytest.mark.parametrize("slow_path", ["/data", "/uummannaq", "/health"])
+def test_a_slow_query_does_not_block_other_requests(slow_database, slow_path, monkeypatch):
+    if slow_path == "/health":
+        monkeypatch.setattr(
+            main, "_probe_database", lambda: time.sleep(SLOW_QUERY_SECONDS) or {"status": "ok"}
+        )
+    elapsed, status = asyncio.run(_race(slow_path))
+    assert status == 200
+    assert elapsed < SLOW_QUERY_SECONDS / 2
+
+
+@pytest.mark.parametrize("slow_path", ["/data", "/uummannaq"])
+def test_compressing_a_body_does_not_block_other_requests(database, slow_path, monkeypatch):
+    compressing = threading.Event()
+    started = []
+    compress = main._compress
+
+    def slow_compress(body, encoding, *, once):
+        started.append(time.perf_counter())
+        compressing.set()
+        time.sleep(SLOW_QUERY_SECONDS)
+        return compress(body, encoding, once=once)
+
+    monkeypatch.setattr(main, "_compress", slow_compress)
+
+    async def race():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            slow = asyncio.create_task(client.get(slow_path, headers={"Accept-Encoding": "gzip"}))
+            while not compressing.is_set():
+                await asyncio.sleep(0.01)
+            fast = await client.post("/predict", json={"temperature": 1.0, "co2": 2.0})
+            elapsed = time.perf_counter() - started[0]
+            assert (await slow).headers["Content-Encoding"] == "gzip"
+        return elapsed, fast.status_code
+
+    elapsed, status = asyncio.run(race())
+    assert status == 200
+    assert elapsed < SLOW_QUERY_SECONDS / 2
+
+
+def test_health_does_not_queue_behind_busy_builds(slow_database, monkeypatch):
+    """Every build worker stuck on a slow read; /health still answers at once."""
+    monkeypatch.setattr(main, "_probe_database", lambda: {"status": "ok"})
+    busy = [
+        main._blocking_executor().submit(time.sleep, SLOW_QUERY_SECONDS)
+        for _ in range(main._blocking_executor()._max_workers)
+    ]
+
+    async def probe():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            response = await client.get("/health")
+            return time.perf_counter() - started, response.status_code
+
+    elapsed, status = asyncio.run(probe())
+    assert status == 200
+    assert elapsed < SLOW_QUERY_SECONDS / 2
+    for job in busy:
+        job.result()
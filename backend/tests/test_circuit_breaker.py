@@ -0,0 +1,184 @@
+"""An unreachable database is skipped instead of retried on every request.
+
+The outage is a SQLite file in a directory that does not exist: every connect
+raises OperationalError at once, like a refused Postgres connection.
+"""
+
+from __future__ import annotations
+
+import shutil
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+import main
+
+
+@pytest.fixture
+def outage(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'missing' / 'climate.db'}"
+    monkeypatch.setattr(main, "_resolved_database_url", lambda: url)
+    monkeypatch.setattr(main.settings, "db_breaker_failure_threshold", 3)
+    monkeypatch.setattr(main.settings, "db_breaker_probe_interval_seconds", 30.0)
+    main._dispose_engine()
+    main._invalidate_payload_cache()
+    yield tmp_path / "missing"
+    main._dispose_engine()
+    main._invalidate_payload_cache()
+
+
+@pytest.fixture
+def client(outage):
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _connect():
+    with main._db_connect(main._engine()) as conn:
+        conn.exec_driver_sql("SELECT 1")
+
+
+def _fail(times):
+    for _ in range(times):
+        with pytest.raises(Exception):
+            _connect()
+
+
+def test_outage_errors_open_the_breaker_at_the_threshold(outage):
+    _fail(2)
+    assert main.DB_BREAKER.state == "closed"
+    _fail(1)
+    assert main.DB_BREAKER.state == "open"
+    with pytest.raises(main._DatabaseUnavailable):
+        _connect()
+    assert main.DB_BREAKER.snapshot()["trips"] == 1
+
+
+def test_a_success_resets_the_failure_count(outage):
+    _fail(2)
+    outage.mkdir()
+    _connect()
+    main._engine().dispose()
+    shutil.rmtree(outage)
+    _fail(2)
+    assert main.DB_BREAKER.state == "closed"
+
+
+def test_query_errors_do_not_count_as_an_outage():
+    breaker = main._CircuitBreaker()
+    for _ in range(10):
+        breaker.record(ProgrammingError("SELECT", {}, Exception("no such table")))
+    assert breaker.state == "closed"
+
+
+def test_a_saturated_pool_neither_opens_nor_closes_the_breaker():
+    breaker = main._CircuitBreaker()
+    for _ in range(main.settings.db_breaker_failure_threshold - 1):
+        breaker.record(ConnectionRefusedError())
+    for _ in range(10):
+        breaker.record(PoolTimeoutError("QueuePool limit of size 5 overflow 5 reached"))
+    assert breaker.state == "closed"
+    breaker.record(ConnectionRefusedError())
+    assert breaker.state == "open"
+
+
+def test_a_missing_sqlite_table_is_not_an_outage():
+    missing = OperationalError("SELECT", {}, Exception("no such table: data_version"))
+    assert not main._is_outage(missing)
+    assert main._is_outage(OperationalError("SELECT", {}, Exception("server closed the connection")))
+
+
+class _DroppedConnection:
+    """A connection whose every statement fails like a dead server."""
+
+    dialect = sqlite.dialect()
+
+    def execute(self, *args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("server closed the connection unexpectedly"))
+
+    def rollback(self):
+        pytest.fail("an outage was swallowed")
+
+
+@pytest.mark.parametrize(
+    "lookup",
+    [
+        lambda conn: main._published_version(conn, "data"),
+        lambda conn: main._published_payload(conn, "/data", "v1"),
+        lambda conn: main._stored_decadal_anomaly(conn, "v1"),
+        lambda conn: main._stored_sampling_errors(conn, [2020]),
+        lambda conn: main._read_table(conn, "annual", ("Year",)),
+    ],
+)
+def test_lookups_that_tolerate_a_missing_table_let_an_outage_through(lookup):
+    with pytest.raises(OperationalError):
+        lookup(_DroppedConnection())
+
+
+def test_the_probe_after_the_interval_closes_a_recovered_breaker(outage, monkeypatch):
+    _fail(3)
+    monkeypatch.setattr(main.settings, "db_breaker_probe_interval_seconds", 0.0)
+    outage.mkdir()
+    _connect()
+    assert main.DB_BREAKER.state == "closed"
+    assert main.DB_BREAKER.snapshot()["consecutiveFailures"] == 0
+
+
+def test_a_failed_probe_opens_it_again(outage, monkeypatch):
+    _fail(3)
+    monkeypatch.setattr(main.settings, "db_breaker_probe_interval_seconds", 0.0)
+    _fail(1)
+    assert main.DB_BREAKER.state == "open"
+    assert main.DB_BREAKER.snapshot()["trips"] == 1
+
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = main._CircuitBreaker()
+    for _ in range(main.settings.db_breaker_failure_threshold):
+        breaker.record(ConnectionRefusedError())
+    breaker._opened -= main.settings.db_breaker_probe_interval_seconds
+    assert breaker.allow() is True
+    assert breaker.state == "half-open"
+    assert breaker.allow() is False
+    breaker.record(None)
+    assert breaker.allow() is True
+
+
+def test_an_open_breaker_sends_requests_straight_to_the_fallback(client):
+    for _ in range(3):
+        assert client.get("/data").headers["X-Climate-Db-Status"] == "error"
+    response = client.get("/data")
+    assert response.status_code == 200
+    assert response.headers["X-Climate-Db-Status"] == "circuit-open"
+    assert response.headers["X-Climate-Data-Source"] == "json-fallback"
+
+    started = time.perf_counter()
+    with pytest.raises(main._DatabaseUnavailable):
+        _connect()
+    assert time.perf_counter() - started < 0.01
+
+
+def test_health_reports_the_breaker(client):
+    database = client.get("/health").json()["checks"]["database"]
+    assert database["status"] == "error"
+    assert database["breaker"]["state"] == "closed"
+    assert database["breaker"]["consecutiveFailures"] == 1
+
+    _fail(2)
+    body = client.get("/health").json()
+    database = body["checks"]["database"]
+    assert body["status"] == "degraded"
+    assert database["status"] == "circuit-open"
+    assert database["breaker"]["state"] == "open"
+    assert database["breaker"]["retryInSeconds"] > 0
+    assert "OperationalError" in database["breaker"]["lastError"]
+
+
+def test_disposing_the_engine_keeps_the_breaker(outage):
+    _fail(3)
+    main._dispose_engine()
+    assert main.DB_BREAKER.state == "open"
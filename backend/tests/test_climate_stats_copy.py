@@ -0,0 +1,19 @@
+"""The pipeline's climate_stats.py is the API's, byte for byte.
+
+Each service's image is built from its own directory, so data-pipeline/ carries
+a copy rather than importing backend/climate_stats.py. The stamps only protect
+against different parameters, not different code: a copy that drifted would
+have its stored tables served as if the API had computed them.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_the_pipeline_copy_is_the_api_module():
+    original = (ROOT / "backend" / "climate_stats.py").read_bytes()
+    copy = (ROOT / "data-pipeline" / "climate_stats.py").read_bytes()
+    assert copy == original, "copy backend/climate_stats.py to data-pipeline/climate_stats.py"
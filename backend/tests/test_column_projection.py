@@ -0,0 +1,50 @@
+"""The /data table reads fetch only the columns the payload keeps.
+
+annual holds the whole OWID entity table, 268 columns, of which the payload
+serves nine, and every daily row carried a date string that was dropped again.
+The reads are now projected in SQL. The payload must not notice.
+"""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def unprojected(monkeypatch):
+    monkeypatch.setattr(
+        main, "_DATA_TABLES", {key: (table, None) for key, (table, _) in main._DATA_TABLES.items()}
+    )
+
+
+def test_the_reads_return_only_the_kept_columns(database):
+    with database.connect() as conn:
+        data = main._read_data_tables(conn)
+    assert list(data["annual"][0]) == list(main._ANNUAL_COLUMNS)
+    assert list(data["dailySeaIce"][0]) == ["Year", "DayOfYear", "Extent"]
+
+
+def test_the_served_payload_is_byte_for_byte_unchanged(database, monkeypatch):
+    projected = client.get("/data")
+    main._invalidate_payload_cache()
+    unprojected(monkeypatch)
+    whole = client.get("/data")
+
+    assert projected.headers["X-Climate-Db-Status"] == "ok"
+    assert whole.headers["X-Climate-Db-Status"] == "ok"
+    assert projected.content == whole.content
+
+
+def test_a_table_missing_a_projected_column_is_read_whole(database, monkeypatch):
+    # as if annual predated a column; SQLite reads an unknown quoted name as a
+    # string literal, so the missing one has to be a name it leaves unquoted
+    tables = dict(main._DATA_TABLES)
+    tables["annual"] = ("annual", main._ANNUAL_COLUMNS + ("added_later",))
+    monkeypatch.setattr(main, "_DATA_TABLES", tables)
+    with database.connect() as conn:
+        data = main._read_data_tables(conn)
+    assert len(data["annual"][0]) > len(main._ANNUAL_COLUMNS)
+    assert list(data["dailySeaIce"][0]) == ["Year", "DayOfYear", "Extent"]
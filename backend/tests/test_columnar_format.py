@@ -0,0 +1,99 @@
+"""?format=columnar sends every list of rows as one array per column.
+
+Same content as the default format, only reshaped, so everything here checks
+that nothing is lost in the reshaping and that the two formats do not get in
+each other's way in the cache.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from schemas import DataColumnar, FjordDataColumnar
+
+client = TestClient(main.app)
+
+
+@pytest.fixture(autouse=True)
+def data_file(offline, tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    shutil.copy(main.DATA_FILE, path)
+    monkeypatch.setattr(main, "DATA_FILE", path)
+    monkeypatch.setattr(main, "_utc_now_iso", lambda: "2026-01-01T00:00:00Z")
+
+
+def rows_of(columns: dict) -> list[dict]:
+    names = list(columns)
+    if not names:
+        return []
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def as_records(columnar: dict) -> dict:
+    out = {k: v for k, v in columnar.items() if k != "format"}
+    for key, value in out.items():
+        if isinstance(value, dict) and key != "meta":
+            out[key] = rows_of(value)
+    return out
+
+
+@pytest.mark.parametrize(
+    "path, model",
+    [("/data", DataColumnar), ("/uummannaq", FjordDataColumnar)],
+)
+def test_columnar_holds_exactly_the_records(path, model):
+    records = client.get(path).json()
+    response = client.get(path, params={"format": "columnar"})
+    assert response.status_code == 200
+    columnar = response.json()
+
+    assert columnar["format"] == "columnar"
+    model.model_validate(columnar)
+    assert as_records(columnar) == records
+
+
+def test_the_daily_series_is_three_parallel_arrays():
+    daily = client.get("/data", params={"format": "columnar"}).json()["dailySeaIce"]
+    assert list(daily) == ["Year", "DayOfYear", "Extent"]
+    assert len({len(values) for values in daily.values()}) == 1
+
+
+@pytest.mark.parametrize("path", ["/data", "/uummannaq"])
+def test_columnar_is_much_smaller(path):
+    records = client.get(path)
+    columnar = client.get(path, params={"format": "columnar"})
+    assert len(columnar.content) < 0.5 * len(records.content)
+
+
+def test_each_format_has_its_own_etag():
+    records = client.get("/data")
+    columnar = client.get("/data", params={"format": "columnar"})
+    assert records.headers["ETag"] != columnar.headers["ETag"]
+
+    again = client.get(
+        "/data",
+        params={"format": "columnar"},
+        headers={"If-None-Match": columnar.headers["ETag"]},
+    )
+    assert again.status_code == 304
+    crossed = client.get("/data", headers={"If-None-Match": columnar.headers["ETag"]})
+    assert crossed.status_code == 200
+
+
+def test_one_build_serves_both_formats(monkeypatch):
+    calls = []
+    original = main.compute_decadal_daily_anomaly
+    monkeypatch.setattr(
+        main, "compute_decadal_daily_anomaly", lambda rows: calls.append(1) or original(rows)
+    )
+    client.get("/data", params={"format": "columnar"})
+    client.get("/data")
+    assert len(calls) == 1
+
+
+def test_an_unknown_format_is_rejected():
+    assert client.get("/data", params={"format": "csv"}).status_code == 422
@@ -0,0 +1,98 @@
+"""Payload responses are compressed by Accept-Encoding, once per cached body."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+pytestmark = pytest.mark.usefixtures("offline")
+
+
+@pytest.fixture
+def compressions(monkeypatch):
+    calls: list[str] = []
+    compress = main._compress
+
+    def counted(body, encoding, *, once):
+        calls.append(encoding)
+        return compress(body, encoding, once=once)
+
+    monkeypatch.setattr(main, "_compress", counted)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "header, encodings, expected",
+    [
+        (None, ("br", "gzip"), None),
+        ("identity", ("br", "gzip"), None),
+        ("gzip, deflate", ("br", "gzip"), "gzip"),
+        ("gzip, deflate, br", ("br", "gzip"), "br"),
+        ("gzip, deflate, br", ("gzip",), "gzip"),
+        ("br;q=0.5, gzip", ("br", "gzip"), "gzip"),
+        ("br; q=0, gzip;q=0.1", ("br", "gzip"), "gzip"),
+        ("gzip;q=0", ("br", "gzip"), None),
+        ("*", ("br", "gzip"), "br"),
+        ("*;q=0.2, gzip;q=0.5", ("br", "gzip"), "gzip"),
+        ("GZIP", ("gzip",), "gzip"),
+        ("gzip;q=nonsense", ("gzip",), None),
+    ],
+)
+def test_negotiation(monkeypatch, header, encodings, expected):
+    monkeypatch.setattr(main, "_ENCODINGS", encodings)
+    assert main._accepted_encoding(header) == expected
+
+
+def test_gzip_body_decodes_to_the_plain_one():
+    plain = client.get("/data", headers={"Accept-Encoding": "identity"})
+    packed = client.get("/data", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in plain.headers
+    assert packed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in packed.headers["Vary"]
+    assert packed.content == plain.content
+    assert int(packed.headers["Content-Length"]) * 5 < len(plain.content)
+    assert packed.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+
+
+def test_brotli_when_installed():
+    pytest.importorskip("brotli")
+    plain = client.get("/data", headers={"Accept-Encoding": "identity"})
+    packed = client.get("/data", headers={"Accept-Encoding": "br, gzip"})
+    assert packed.headers["Content-Encoding"] == "br"
+    assert packed.content == plain.content
+
+
+def test_a_cached_body_is_compressed_once(compressions):
+    for _ in range(5):
+        assert client.get("/data", headers={"Accept-Encoding": "gzip"}).status_code == 200
+    assert compressions == ["gzip"]
+
+
+def test_an_uncached_body_is_compressed_per_request(compressions):
+    for _ in range(2):
+        client.get("/data/daily", params={"years": "2012"}, headers={"Accept-Encoding": "gzip"})
+    assert compressions == ["gzip", "gzip"]
+
+
+def test_any_encodings_etag_revalidates():
+    packed = client.get("/data", headers={"Accept-Encoding": "gzip"})
+    again = client.get(
+        "/data",
+        headers={"Accept-Encoding": "identity", "If-None-Match": packed.headers["ETag"]},
+    )
+    assert again.status_code == 304
+    assert again.headers["ETag"] == packed.headers["ETag"].replace("-gzip", "")
+
+
+def test_small_bodies_and_parquet_are_sent_as_they_are():
+    empty = client.get("/data/daily", params={"years": "1900"}, headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in empty.headers
+    pytest.importorskip("pyarrow")
+    parquet = client.get("/data/daily.parquet", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in parquet.headers
+    assert "Accept-Encoding" not in parquet.headers.get("Vary", "")
@@ -0,0 +1,66 @@
+"""/data's table reads run side by side on their own pooled connections."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import main
+
+client = TestClient(main.app)
+
+
+@pytest.fixture
+def in_flight(database):
+    """Most statements ever running at once, each held open for 50 ms."""
+    lock = threading.Lock()
+    state = {"now": 0, "most": 0}
+
+    @event.listens_for(database, "before_cursor_execute")
+    def started(*_):
+        with lock:
+            state["now"] += 1
+            state["most"] = max(state["most"], state["now"])
+        time.sleep(0.05)
+
+    @event.listens_for(database, "after_cursor_execute")
+    def finished(*_):
+        with lock:
+            state["now"] -= 1
+
+    return state
+
+
+def test_the_reads_overlap(database, in_flight):
+    response = client.get("/data")
+    assert response.headers["X-Climate-Db-Status"] == "ok"
+    assert in_flight["most"] >= 2
+    assert database.pool.checkedout() == 0
+
+
+def test_the_payload_is_the_same_read_one_by_one(database, monkeypatch):
+    concurrent = client.get("/data").content
+    main._invalidate_payload_cache()
+    monkeypatch.setattr(main.settings, "db_read_concurrency", 1)
+    assert client.get("/data").content == concurrent
+
+
+def test_a_selection_reads_concurrently_too(database, in_flight):
+    body = client.get("/data", params={"fields": "corrMatrix,iqrStats"}).json()
+    assert set(body) == {"corrMatrix", "iqrStats", "meta"}
+    assert in_flight["most"] >= 2
+
+
+def test_a_failed_read_falls_back_to_the_file(database, monkeypatch):
+    tables = dict(main._DATA_TABLES)
+    tables["iqrStats"] = ("no_such_table", None)
+    monkeypatch.setattr(main, "_DATA_TABLES", tables)
+    response = client.get("/data")
+    assert response.status_code == 200
+    assert response.headers["X-Climate-Db-Status"] == "error"
+    assert response.headers["X-Climate-Data-Source"] == "json-fallback"
+    assert database.pool.checkedout() == 0
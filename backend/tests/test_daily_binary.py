@@ -0,0 +1,106 @@
+"""The daily records as Arrow streams and Parquet files.
+
+Same rows as the JSON payloads, so these read the binary bodies back and compare
+them against the JSON the routes already serve, for both the database and the
+file fallback.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet  # noqa: E402
+
+client = TestClient(main.app)
+
+
+def read(response) -> pd.DataFrame:
+    if response.headers["content-type"] == main._ARROW_MEDIA_TYPE:
+        table = pa.ipc.open_stream(response.content).read_all()
+    else:
+        table = pa.parquet.read_table(io.BytesIO(response.content))
+    return table.to_pandas()
+
+
+@pytest.fixture
+def database(sqlite_database):
+    rows = json.loads(main.DATA_FILE.read_text())["dailySeaIce"]
+    pd.DataFrame(rows).to_sql("daily_sea_ice", sqlite_database, index=False)
+    pd.DataFrame(
+        {
+            "date": ["2024-03-01", "2024-03-02", "2024-03-03"],
+            "year": [2024, 2024, 2024],
+            "doy": [61, 62, 63],
+            "frac": [0.9, 0.85, None],
+            "frac_raw": [0.91, None, None],
+        }
+    ).to_sql("fjord_daily", sqlite_database, index=False)
+    return sqlite_database
+
+
+def archive_daily() -> pd.DataFrame:
+    rows = json.loads(main.DATA_FILE.read_text())["dailySeaIce"]
+    return pd.DataFrame(rows)[["Year", "DayOfYear", "Extent"]]
+
+
+@pytest.mark.parametrize("suffix", ["arrow", "parquet"])
+def test_the_sea_ice_record_from_the_file(offline, suffix):
+    response = client.get(f"/data/daily.{suffix}")
+    assert response.status_code == 200
+    assert response.headers["X-Climate-Data-Source"] == "json-fallback"
+    frame = read(response)
+    assert list(frame.dtypes.astype(str)) == ["int32", "int32", "float64"]
+    pd.testing.assert_frame_equal(frame, archive_daily(), check_dtype=False)
+
+
+@pytest.mark.parametrize("suffix", ["arrow", "parquet"])
+def test_the_sea_ice_record_from_the_database(database, suffix):
+    response = client.get(f"/data/daily.{suffix}")
+    assert response.headers["X-Climate-Db-Status"] == "ok"
+    pd.testing.assert_frame_equal(read(response), archive_daily(), check_dtype=False)
+
+
+def test_fjord_daily_keeps_dates_and_missing_values(database):
+    frame = read(client.get("/uummannaq/daily.arrow"))
+    assert list(frame.columns) == ["date", "year", "doy", "frac", "fracRaw"]
+    assert str(frame["date"].iloc[0]) == "2024-03-01"
+    assert frame["frac"].isna().tolist() == [False, False, True]
+    assert frame["fracRaw"].isna().tolist() == [False, True, True]
+
+
+def test_fjord_daily_matches_the_json_route(offline):
+    if main._find_fjord_csv() is None and not main.FJORD_DATA_FILE.exists():
+        pytest.skip("no fjord data in this checkout")
+    daily = pd.DataFrame(client.get("/uummannaq").json()["daily"])
+    frame = read(client.get("/uummannaq/daily.parquet"))
+    assert frame["date"].astype(str).tolist() == daily["date"].tolist()
+    pd.testing.assert_series_equal(frame["frac"], daily["frac"], check_names=False)
+
+
+def test_postgres_copy_output_parses_like_the_cursor():
+    # COPY ... TO STDOUT WITH (FORMAT csv) writes NULL as an empty field
+    raw = io.BytesIO(b"2024-03-01,2024,61,0.9,0.91\n2024-03-02,2024,62,,\n")
+    table = main._arrow_from_csv(main._DAILY_SERIES["/uummannaq/daily"], raw)
+    assert table.schema == main._arrow_schema(main._DAILY_SERIES["/uummannaq/daily"])
+    assert table.column("fracRaw").to_pylist() == [0.91, None]
+
+
+def test_repeat_requests_revalidate(offline):
+    first = client.get("/data/daily.arrow")
+    again = client.get("/data/daily.arrow", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert client.get("/data/daily.parquet").headers["ETag"] != first.headers["ETag"]
+
+
+def test_the_binary_record_is_far_smaller_than_json(offline):
+    json_bytes = len(json.dumps(client.get("/data").json()["dailySeaIce"]))
+    assert len(client.get("/data/daily.parquet").content) < json_bytes / 10
@@ -0,0 +1,148 @@
+"""GET /data/daily returns the slice of the daily record a query asks for.
+
+The same query runs as SQL against daily_sea_ice and against the in-memory
+index over data.json; both are checked against a plain pandas filter of the
+whole record.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+
+import main
+
+PIPELINE = Path(__file__).resolve().parents[2] / "data-pipeline"
+sys.path.insert(0, str(PIPELINE))
+
+import update_pipeline  # noqa: E402
+
+client = TestClient(main.app)
+
+QUERIES = [
+    {},
+    {"from": "2012-03-01", "to": "2012-09-30"},
+    {"from": "2024-12-25"},
+    {"to": "1978-11-01"},
+    {"years": "1980,2012,2019-2021"},
+    {"doy_from": 244, "doy_to": 274},
+    {"doy_from": 300, "doy_to": 60, "years": "2015-2016"},
+    {"doy_from": 366},
+    {"doy_to": 1, "from": "2000-01-01", "to": "2005-12-31"},
+    {"years": "1900"},
+]
+
+
+@pytest.fixture(scope="module")
+def record() -> pd.DataFrame:
+    rows = json.loads(main.DATA_FILE.read_text())["dailySeaIce"]
+    return pd.DataFrame(rows)[["Year", "DayOfYear", "Extent"]]
+
+
+def expected(record: pd.DataFrame, params: dict) -> list[dict]:
+    keep = pd.Series(True, index=record.index)
+    key = record["Year"] * 1000 + record["DayOfYear"]
+    for name, op in (("from", key.ge), ("to", key.le)):
+        if name in params:
+            day = date.fromisoformat(params[name])
+            keep &= op(day.year * 1000 + day.timetuple().tm_yday)
+    if "years" in params:
+        years = main._parse_years(params["years"])
+        keep &= record["Year"].isin(years)
+    lo, hi = params.get("doy_from"), params.get("doy_to")
+    if lo is not None and hi is not None and lo > hi:
+        keep &= (record["DayOfYear"] >= lo) | (record["DayOfYear"] <= hi)
+    else:
+        if lo is not None:
+            keep &= record["DayOfYear"] >= lo
+        if hi is not None:
+            keep &= record["DayOfYear"] <= hi
+    selected = record[keep].sort_values(["Year", "DayOfYear"], kind="stable")
+    return selected.to_dict(orient="records")
+
+
+@pytest.fixture
+def database(sqlite_database, record):
+    # Shuffled, so ORDER BY is what puts the rows in order.
+    record.sample(frac=1, random_state=7).to_sql("daily_sea_ice", sqlite_database, index=False)
+    update_pipeline.index_daily_sea_ice(sqlite_database)
+    return sqlite_database
+
+
+@pytest.mark.parametrize("params", QUERIES)
+def test_the_file_index_matches_a_full_scan(offline, record, params):
+    response = client.get("/data/daily", params=params)
+    assert response.status_code == 200
+    assert response.headers["X-Climate-Data-Source"] == "json-fallback"
+    body = response.json()
+    assert body["dailySeaIce"] == expected(record, params)
+    assert body["count"] == len(body["dailySeaIce"])
+
+
+@pytest.mark.parametrize("params", QUERIES)
+def test_the_database_query_matches_a_full_scan(database, record, params):
+    response = client.get("/data/daily", params=params)
+    assert response.headers["X-Climate-Db-Status"] == "ok"
+    assert response.json()["dailySeaIce"] == expected(record, params)
+
+
+def test_the_pipeline_indexes_year_and_day(database):
+    indexes = inspect(database).get_indexes("daily_sea_ice")
+    assert [(i["name"], i["column_names"]) for i in indexes] == [
+        ("daily_sea_ice_year_doy", ["Year", "DayOfYear"])
+    ]
+
+
+def test_a_season_is_a_fraction_of_the_record(offline):
+    season = client.get("/data/daily", params={"from": "2024-09-01", "to": "2025-03-31"})
+    whole = client.get("/data")
+    assert len(season.content) * 50 < len(whole.content)
+
+
+def test_columnar_and_revalidation(offline):
+    params = {"years": "2012"}
+    rows = client.get("/data/daily", params=params).json()["dailySeaIce"]
+    columnar = client.get("/data/daily", params={**params, "format": "columnar"})
+    body = columnar.json()
+    assert body["format"] == "columnar"
+    assert body["dailySeaIce"]["Extent"] == [row["Extent"] for row in rows]
+    again = client.get(
+        "/data/daily",
+        params={**params, "format": "columnar"},
+        headers={"If-None-Match": columnar.headers["ETag"]},
+    )
+    assert again.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"years": "twenty"},
+        {"years": "2020-2010"},
+        {"years": "1-9999"},
+        {"from": "2020-01-02", "to": "2020-01-01"},
+        {"from": "yesterday"},
+        {"doy_from": 0},
+        {"doy_to": 367},
+    ],
+)
+def test_bad_queries_are_rejected(offline, params):
+    assert client.get("/data/daily", params=params).status_code == 422
+
+
+def test_the_index_follows_the_file(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"dailySeaIce": [{"Year": 2020, "DayOfYear": 1, "Extent": 1.0}]}))
+    monkeypatch.setattr(main, "DATA_FILE", path)
+    assert main._file_daily_index().select(main._DailyRange()) == [
+        {"Year": 2020, "DayOfYear": 1, "Extent": 1.0}
+    ]
+    path.write_text(json.dumps({"dailySeaIce": [{"Year": 2021, "DayOfYear": 200, "Extent": 2.5}]}))
+    assert main._file_daily_index().select(main._DailyRange())[0]["Year"] == 2021
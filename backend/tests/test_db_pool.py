@@ -0,0 +1,70 @@
+"""Every database route shares one pooled engine per process.
+
+/data and /uummannaq used to build a fresh engine, and with it a fresh pool and
+a full connection handshake, on every request. These hold the replacement in
+place: one engine, configured from settings, counted, and disposed on shutdown.
+"""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    monkeypatch.setattr(main, "_resolved_database_url", lambda: url)
+    main._dispose_engine()
+    main.POOL_STATS.reset()
+    yield url
+    main._dispose_engine()
+
+
+def test_postgres_engines_bound_connect_and_statement_time():
+    options = main._engine_options("postgresql+psycopg2://u:p@db:5432/climate")
+    assert options["pool_size"] == main.settings.db_pool_size
+    assert options["max_overflow"] == main.settings.db_max_overflow
+    assert options["pool_pre_ping"] is main.settings.db_pool_pre_ping
+    connect_args = options["connect_args"]
+    assert connect_args["connect_timeout"] == main.settings.db_connect_timeout_seconds
+    assert f"statement_timeout={main.settings.db_statement_timeout_ms}" in connect_args["options"]
+
+
+def test_libpq_options_are_not_passed_to_other_drivers():
+    assert "connect_args" not in main._engine_options("sqlite:///x.db")
+
+
+def test_one_engine_is_shared_across_calls(sqlite_engine):
+    assert main._engine() is main._engine()
+
+
+def test_connections_are_counted(sqlite_engine):
+    engine = main._engine()
+    for _ in range(3):
+        with main._db_connect(engine) as conn:
+            conn.exec_driver_sql("SELECT 1")
+    report = main._pool_report()
+    assert report["acquisitions"] == 3
+    assert report["checkouts"] == 3
+    assert report["checkins"] == 3
+    # one physical connection, reused
+    assert report["connects"] == 1
+
+
+def test_health_reports_the_pool(sqlite_engine):
+    with TestClient(app) as client:
+        body = client.get("/health").json()
+    database = body["checks"]["database"]
+    assert database["status"] == "ok"
+    assert database["pool"]["checkouts"] >= 1
+
+
+def test_shutdown_disposes_the_engine(sqlite_engine):
+    with TestClient(app) as client:
+        client.get("/health")
+        assert main._engine_instance is not None
+    assert main._engine_instance is None
@@ -0,0 +1,239 @@
+"""The vectorised decadal anomaly must publish exactly what the pandas one did.
+
+compute_decadal_daily_anomaly was rewritten from per-year pandas lambdas into
+NumPy on a dense year x day array. The extents carry three decimals, so the
+decade means land exactly on the 0.0005 rounding boundary far more often than
+chance would suggest, and a last-bit difference anywhere upstream flips a
+published value. A close match is therefore not good enough: these compare
+record by record, type by type, against the previous implementation, kept
+below verbatim as the reference.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+from settings import Settings
+
+
+# --- the previous implementation, unchanged ---------------------------------
+
+
+def _reference_normalize(df: pd.DataFrame) -> pd.DataFrame:
+    # toleriert unterschiedliche Groß/Kleinschreibung / Namen
+    colmap = {c.lower(): c for c in df.columns}
+    def grab(*cands):
+        for c in cands:
+            if c in df.columns: return c
+            if c.lower() in colmap: return colmap[c.lower()]
+        raise KeyError(cands[0])
+    return df.rename(columns={
+        grab('Year','year'): 'year',
+        grab('DayOfYear','doy','dayofyear'): 'doy',
+        grab('Extent','extent','value'): 'extent',
+    })[['year','doy','extent']]
+
+
+def reference_decadal_anomaly(daily_rows: List[dict], settings: Settings) -> List[dict]:
+    if not daily_rows:
+        return []
+
+    # -------- Konfiguration (ENV überschreibbar) -------------
+    YR_MIN = settings.seaice_yr_min
+    YR_MAX = settings.seaice_yr_max
+    BASE0  = settings.seaice_anom_baseline_start
+    BASE1  = settings.seaice_anom_baseline_end
+    W_YEAR = max(1, settings.seaice_smooth_window)       # jährl. Vor-Glättung
+    W_DEC  = max(1, settings.seaice_decadal_smooth)     # n a c h Dekadenmittel
+
+    # -------- Hilfsfunktionen --------------------------------
+    def _circular_smooth(y: np.ndarray, win: int) -> np.ndarray:
+        """Zyklische Faltung (Wrap-Around) mit Hamming-Fenster."""
+        if win <= 1 or not np.isfinite(y).any():
+            return y
+        if win % 2 == 0:  # Fenster muss ungerade sein
+            win += 1
+        k = np.hamming(win)
+        k = k / k.sum()
+        h = win // 2
+        # fehlende Tage vorher per Interpolation füllen
+        s = pd.Series(y, index=np.arange(1, 366), dtype="float64")
+        s = s.interpolate(limit_direction="both")
+        y = s.values
+        ypad = np.r_[y[-h:], y, y[:h]]
+        out = np.convolve(ypad, k, mode="same")[h:-h]
+        return out
+
+    # -------- Rohdaten normalisieren --------------------------
+    df = pd.DataFrame(daily_rows)
+    df = _reference_normalize(df).copy()
+    df = df.dropna(subset=['year','doy','extent'])
+    df[['year','doy']] = df[['year','doy']].astype(int)
+    df['extent'] = pd.to_numeric(df['extent'], errors='coerce')
+    df = df[(df['year'] >= YR_MIN) & (df['year'] <= YR_MAX)].copy()
+
+    # 29. Feb entfernen und auf 365-Tage-Kalender mappen
+    dt = (pd.to_datetime(df['year'].astype(str), format='%Y')
+          + pd.to_timedelta(df['doy'] - 1, unit='D'))
+    mask_leap = (dt.dt.month == 2) & (dt.dt.day == 29)
+    df = df.loc[~mask_leap].copy()
+    dt = dt.loc[~mask_leap]
+    df['day'] = pd.to_datetime(dt.dt.strftime('2001-%m-%d')).dt.dayofyear
+
+    # jährliche Vor-Glättung (zentrierter MA)
+    df = df.sort_values(['year','day'])
+    df['extent_smooth'] = (
+        df.groupby('year', sort=False)['extent']
+          .transform(lambda s: s.rolling(window=W_YEAR, center=True,
+                                         min_periods=max(2, W_YEAR//2)).mean())
+          .bfill().ffill()
+    )
+
+    # Baseline 1981–2010 (oder ENV)
+    clim = (df[(df['year']>=BASE0) & (df['year']<=BASE1)]
+              .groupby('day', as_index=True)['extent_smooth']
+              .mean())
+
+    # Anomalie und Dekade
+    df['an'] = df['extent_smooth'] - df['day'].map(clim)
+    df['decade'] = ((df['year']//10)*10).astype(int).astype(str) + 's'
+
+    # Tagesmittel je Dekade (+ SD, N)
+    agg = (df.groupby(['decade','day'], as_index=False)['an']
+             .agg(['mean','std','count'])
+             .reset_index()
+             .rename(columns={'mean':'an','std':'sd','count':'n'}))
+
+    # Zyklische Glättung über den Saisonverlauf pro Dekade
+    wide = (agg.pivot(index='day', columns='decade', values='an')
+              .reindex(np.arange(1, 366)))
+    smoothed_frames = []
+    for dec in wide.columns:
+        y = wide[dec].to_numpy(dtype='float64')
+        y_s = _circular_smooth(y, W_DEC)
+        smoothed_frames.append(
+            pd.DataFrame({'decade': dec, 'day': np.arange(1, 366), 'an': np.round(y_s, 3)})
+        )
+    out = pd.concat(smoothed_frames, ignore_index=True)
+
+    # sd und n wieder anheften (praktisch für Unsicherheitsbänder)
+    meta = agg[['decade','day','sd','n']].copy()
+    meta['sd'] = meta['sd'].round(3)
+    out = out.merge(meta, on=['decade','day'], how='left').sort_values(['decade','day'])
+
+    return out.to_dict(orient='records')
+
+
+# --- comparison -------------------------------------------------------------
+
+
+def assert_same_records(expected: List[dict], actual: List[dict]) -> None:
+    assert len(actual) == len(expected)
+    for want, got in zip(expected, actual):
+        assert list(got) == list(want)
+        for key, value in want.items():
+            other = got[key]
+            assert type(other) is type(value), (key, want, got)
+            if isinstance(value, float) and math.isnan(value):
+                assert math.isnan(other), (key, want, got)
+            else:
+                assert other == value, (key, want, got)
+
+
+@pytest.fixture(scope="module")
+def daily_rows():
+    return json.loads(main.DATA_FILE.read_text())["dailySeaIce"]
+
+
+def run_both(monkeypatch, rows, **overrides):
+    config = Settings(**overrides)
+    monkeypatch.setattr(main, "settings", config)
+    return reference_decadal_anomaly(rows, config), main.compute_decadal_daily_anomaly(rows)
+
+
+# --- the published record -----------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"seaice_smooth_window": 11},
+        {"seaice_smooth_window": 4, "seaice_decadal_smooth": 8},
+        {"seaice_smooth_window": 2, "seaice_decadal_smooth": 31},
+        {"seaice_decadal_smooth": 1},
+        {"seaice_yr_min": 1979, "seaice_anom_baseline_start": 1991, "seaice_anom_baseline_end": 2020},
+        {"seaice_yr_min": 1978, "seaice_yr_max": 1987},
+    ],
+    ids=["defaults", "w11", "even-windows", "w2-d31", "no-decadal", "baseline-1991", "early-only"],
+)
+def test_matches_the_pandas_version_on_the_archive(monkeypatch, daily_rows, overrides):
+    expected, actual = run_both(monkeypatch, daily_rows, **overrides)
+    assert_same_records(expected, actual)
+
+
+def test_the_unsmoothed_means_hit_rounding_ties(monkeypatch, daily_rows):
+    """Why bit-for-bit matters: with no decadal smoothing the means are exposed
+    directly, and some sit exactly on a 0.0005 boundary."""
+
+    expected, actual = run_both(monkeypatch, daily_rows, seaice_decadal_smooth=1)
+    assert_same_records(expected, actual)
+    assert len(expected) == 365 * len({r["decade"] for r in expected})
+
+
+# --- shapes the archive does not have -------------------------------------------
+
+
+def synthetic(years, *, step=1, gaps=(), nan_days=()):
+    rng = np.random.default_rng(7)
+    rows = []
+    for year in years:
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        for doy in range(1, 366 + leap, step):
+            if (year, doy) in gaps:
+                continue
+            value = None if (year, doy) in nan_days else round(
+                12 + 4 * math.cos(2 * math.pi * doy / 365) + rng.normal(0, 0.3), 3
+            )
+            rows.append({"year": year, "doy": doy, "extent": value})
+    return rows
+
+
+def test_every_other_day_years_smooth_over_observations(monkeypatch):
+    rows = synthetic(range(1980, 1984), step=2) + synthetic(range(1984, 1996))
+    assert_same_records(*run_both(monkeypatch, rows))
+
+
+def test_a_decade_missing_whole_days_reports_no_n(monkeypatch):
+    # 1978-1979 only: every other day, so odd days have no rows at all and n
+    # becomes a float column with NaN, exactly as the old merge produced
+    rows = synthetic(range(1978, 1984), step=2)
+    expected, actual = run_both(monkeypatch, rows, seaice_yr_min=1978, seaice_anom_baseline_start=1978)
+    assert any(isinstance(r["n"], float) for r in expected)
+    assert_same_records(expected, actual)
+
+
+def test_gaps_missing_values_and_leap_years(monkeypatch):
+    gaps = {(1988, d) for d in range(100, 140)} | {(1992, 60), (1996, 61)}
+    nan_days = {(1990, 5), (1990, 6), (2000, 366)}
+    rows = synthetic(range(1985, 2005), gaps=gaps, nan_days=nan_days)
+    assert_same_records(*run_both(monkeypatch, rows))
+
+
+def test_capitalised_columns_and_string_numbers(monkeypatch):
+    rows = [
+        {"Year": str(r["year"]), "DayOfYear": r["doy"], "Extent": r["extent"]}
+        for r in synthetic(range(1981, 1992))
+    ]
+    assert_same_records(*run_both(monkeypatch, rows))
+
+
+def test_empty_input():
+    assert main.compute_decadal_daily_anomaly([]) == []
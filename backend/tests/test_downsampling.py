@@ -0,0 +1,117 @@
+"""?max_points thins a daily series without losing its extremes.
+
+Each bucket keeps its lowest and highest row, so every minimum and maximum
+the full series draws is still drawn after thinning.
+"""
+
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def bucket_extremes_kept(values: np.ndarray, max_points: int, kept: np.ndarray) -> bool:
+    buckets = (max_points - 2) // 2
+    bucket = np.arange(len(values) - 2) * buckets // (len(values) - 2)
+    chosen = set(kept.tolist())
+    for b in range(buckets):
+        rows = np.flatnonzero(bucket == b) + 1
+        present = rows[~np.isnan(values[rows])]
+        if len(present) == 0:
+            if not chosen & set(rows.tolist()):
+                return False
+            continue
+        if values[present].min() not in values[[i for i in rows if i in chosen]]:
+            return False
+        if values[present].max() not in values[[i for i in rows if i in chosen]]:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_series_keep_their_shape(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(3, 5000))
+    values = np.cumsum(rng.normal(size=n))
+    values[rng.random(n) < 0.1] = np.nan
+    max_points = int(rng.integers(main._MIN_POINTS, 600))
+    kept = main._downsample_indices(values, max_points)
+
+    assert len(kept) <= max_points
+    assert np.all(np.diff(kept) > 0)
+    if n <= max_points:
+        assert kept.tolist() == list(range(n))
+        return
+    assert kept[0] == 0 and kept[-1] == n - 1
+    assert bucket_extremes_kept(values, max_points, kept)
+    assert np.nanmin(values) in values[kept] and np.nanmax(values) in values[kept]
+
+
+def test_a_bucket_without_values_keeps_its_gap():
+    values = np.array([1.0] + [np.nan] * 10 + [2.0] * 10 + [3.0])
+    kept = main._downsample_indices(values, 6)
+    assert np.isnan(values[kept]).any()
+
+
+def test_the_daily_record_thinned(offline):
+    full = client.get("/data/daily").json()["dailySeaIce"]
+    response = client.get("/data/daily", params={"max_points": 600})
+    body = response.json()
+    assert body["count"] == len(body["dailySeaIce"]) <= 600
+    assert body["downsampledFrom"] == len(full)
+    positions = [full.index(row) for row in body["dailySeaIce"][:50]]
+    assert positions == sorted(positions)
+    extents = [row["Extent"] for row in full]
+    assert min(extents) in [row["Extent"] for row in body["dailySeaIce"]]
+    assert len(response.content) * 10 < len(client.get("/data/daily").content)
+
+
+def test_thinned_bodies_are_cached_per_point_count(offline):
+    first = client.get("/data/daily", params={"max_points": 300})
+    assert ("/data/daily?max_points=300", "records") in main._PAYLOAD_CACHE
+    again = client.get("/data/daily", params={"max_points": 300})
+    assert again.headers["ETag"] == first.headers["ETag"]
+    other = client.get("/data/daily", params={"max_points": 400})
+    assert other.headers["ETag"] != first.headers["ETag"]
+
+
+def test_a_short_query_is_not_thinned(offline):
+    body = client.get("/data/daily", params={"years": "2012", "max_points": 1000}).json()
+    assert body["count"] == 366 and body["downsampledFrom"] is None
+
+
+def test_binary_series_thinned(offline):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc  # noqa: F401
+
+    content = client.get("/data/daily.arrow", params={"max_points": 200}).content
+    table = pa.ipc.open_stream(io.BytesIO(content)).read_all()
+    assert table.num_rows <= 200
+    assert table.schema.names == ["Year", "DayOfYear", "Extent"]
+
+
+@pytest.mark.parametrize("max_points", [0, 3, 10**6])
+def test_out_of_range_point_counts_are_rejected(offline, max_points):
+    assert client.get("/data/daily", params={"max_points": max_points}).status_code == 422
+
+
+def test_the_fjord_daily_series_thinned(offline):
+    full = client.get("/uummannaq").json()
+    body = client.get("/uummannaq", params={"max_points": 300}).json()
+    assert len(full["daily"]) > 300 and full["dailyDownsampledFrom"] is None
+    assert len(body["daily"]) <= 300
+    assert body["dailyDownsampledFrom"] == len(full["daily"])
+    fracs = [row["frac"] for row in full["daily"] if row["frac"] is not None]
+    kept = [row["frac"] for row in body["daily"]]
+    assert min(fracs) in kept and max(fracs) in kept
+    # only the series is thinned; what is derived from it used every day
+    for key in ("spring", "season", "frac", "freeze", "seasonLossPct"):
+        assert body[key] == full[key]
+    assert ("/uummannaq?max_points=300", "records") in main._PAYLOAD_CACHE
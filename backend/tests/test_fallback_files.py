@@ -0,0 +1,121 @@
+"""data.json and fjord_data.json are parsed once per file version.
+
+Every ?fields= selection, format and max_points is its own cached body, and each
+one used to parse the file and, on /data, recompute the decadal anomaly again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+@pytest.fixture
+def files(offline, tmp_path, monkeypatch):
+    data = tmp_path / "data.json"
+    fjord = tmp_path / "fjord_data.json"
+    shutil.copy(main.DATA_FILE, data)
+    fjord.write_text(
+        json.dumps(
+            {
+                "spring": [],
+                "season": [],
+                "frac": [],
+                "freeze": [],
+                "daily": [
+                    {"date": f"2024-03-{day:02d}", "year": 2024, "doy": 60 + day, "frac": 0.9}
+                    for day in range(1, 31)
+                ],
+            }
+        )
+    )
+    monkeypatch.setattr(main, "DATA_FILE", data)
+    monkeypatch.setattr(main, "FJORD_DATA_FILE", fjord)
+    return data, fjord
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    original = main._read_json
+
+    def counting(path):
+        calls.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(main, "_read_json", counting)
+    return calls
+
+
+@pytest.fixture
+def anomalies(monkeypatch):
+    calls = []
+    original = main.compute_decadal_daily_anomaly
+
+    def counting(rows):
+        calls.append(len(rows))
+        return original(rows)
+
+    monkeypatch.setattr(main, "compute_decadal_daily_anomaly", counting)
+    return calls
+
+
+def test_every_data_view_shares_one_parse(files, reads, anomalies):
+    for params in (
+        {},
+        {"format": "columnar"},
+        {"fields": "dailySeaIce,decadalAnomaly"},
+        {"fields": "annual"},
+    ):
+        assert client.get("/data", params=params).status_code == 200
+    assert client.get("/data/daily", params={"years": "2020"}).status_code == 200
+    assert client.get("/data/daily", params={"max_points": 500}).status_code == 200
+    assert reads == ["data.json"]
+    assert len(anomalies) == 1
+
+
+def test_the_fjord_file_is_parsed_once(files, reads):
+    client.get("/uummannaq")
+    client.get("/uummannaq", params={"format": "columnar"})
+    assert client.get("/uummannaq/daily.arrow", params={"max_points": 10}).status_code == 200
+    assert reads == ["fjord_data.json"]
+
+
+def test_a_new_day_rebuilds_the_body_but_not_the_parse(files, reads, anomalies, monkeypatch):
+    client.get("/data")
+    monkeypatch.setattr(main, "_utc_today", lambda: date(2099, 1, 1))
+    assert client.get("/data").status_code == 200
+    assert reads == ["data.json"]
+    assert len(anomalies) == 1
+
+
+def test_a_changed_file_is_read_again(files, reads, anomalies):
+    data, _ = files
+    first = client.get("/data/daily", params={"years": "2020"}).json()
+    client.get("/data")
+
+    content = data.read_bytes()
+    data.write_bytes(content.replace(b'"Extent":', b'"Extent" :', 1))
+    stat = data.stat()
+    os.utime(data, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert client.get("/data/daily", params={"years": "2020"}).json() == first
+    client.get("/data")
+    assert reads == ["data.json", "data.json"]
+    assert len(anomalies) == 2
+
+
+def test_callers_do_not_change_the_shared_document(files):
+    client.get("/data")
+    document = main._fallback_file(files[0])
+    assert "meta" not in document.data
+    assert "decadalAnomaly" not in document.data
@@ -0,0 +1,68 @@
+"""Payload bodies are rendered with orjson, to the same JSON as before."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def stdlib(content) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def test_the_data_payload_renders_byte_for_byte_as_json_dumps():
+    data = main._read_json(main.DATA_FILE)
+    data["decadalAnomaly"] = main.compute_decadal_daily_anomaly(data["dailySeaIce"])
+    content = main._payload_content(main.DataResponse, main._slim_data_payload(data))
+    assert main._render_json(content) == stdlib(content)
+    columnar = main._columnar(content)
+    assert main._render_json(columnar) == stdlib(columnar)
+
+
+def test_awkward_values():
+    content = {"text": "Qaanaaq – Uummannaq ❄", "small": 1e-7, "big": 12345678901234567890}
+    # exponents are written 1e-7 rather than 1e-07, the same number
+    assert json.loads(main._render_json(content)) == content
+    assert "❄".encode() in main._render_json(content)
+    assert main._render_json({"nan": math.nan, 2017: np.float64(0.5)}) == b'{"nan":null,"2017":0.5}'
+
+
+def test_the_fjord_file_is_validated_once(offline, tmp_path, monkeypatch):
+    fjord = tmp_path / "fjord_data.json"
+    fjord.write_text(
+        json.dumps(
+            {
+                "spring": [],
+                "season": [],
+                "frac": [],
+                "freeze": [],
+                "daily": [{"date": "2024-03-01", "year": 2024, "doy": 61, "frac": 0.9}],
+            }
+        )
+    )
+    monkeypatch.setattr(main, "FJORD_DATA_FILE", fjord)
+    calls = []
+    content = main._payload_content
+    monkeypatch.setattr(
+        main, "_payload_content", lambda *args: calls.append(args[0]) or content(*args)
+    )
+    bodies = {client.get("/uummannaq").content for _ in range(3)}
+    assert len(bodies) == 1 and len(calls) == 1
+    assert json.loads(bodies.pop())["daily"][0]["fracRaw"] is None
+
+
+def test_openapi_still_describes_the_payloads():
+    schema = client.get("/openapi.json").json()
+    for path in ("/data", "/uummannaq"):
+        responses = schema["paths"][path]["get"]["responses"]["200"]["content"]["application/json"]
+        assert "anyOf" in responses["schema"]
+    assert "FjordDailyRow" in schema["components"]["schemas"]
@@ -0,0 +1,120 @@
+"""/data?fields= serves only the named sections, and does only their work.
+
+Every selection must carry exactly the sections of the full payload it names,
+with the same meta, while the tables and the decadal anomaly behind the other
+sections are left alone.
+"""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import main
+
+client = TestClient(main.app)
+
+SELECTIONS = [
+    "corrMatrix",
+    "iqrStats,corrMatrix",
+    "decadalAnomaly",
+    "partial2025,latestSeaIceSeason",
+    "annual,annualAnomaly,meta",
+    "dailySeaIce",
+]
+
+
+@pytest.fixture(autouse=True)
+def fixed_clock(monkeypatch):
+    monkeypatch.setattr(main, "_utc_now_iso", lambda: "2026-01-01T00:00:00Z")
+    main._invalidate_payload_cache()
+    yield
+    main._invalidate_payload_cache()
+
+
+def statements(engine) -> list[str]:
+    seen: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: seen.append(args[2]))
+    return seen
+
+
+@pytest.mark.parametrize("fields", SELECTIONS)
+@pytest.mark.parametrize("where", ["offline", "database"])
+def test_a_selection_is_a_slice_of_the_full_payload(request, where, fields):
+    request.getfixturevalue(where)
+    full = client.get("/data").json()
+    response = client.get("/data", params={"fields": fields})
+    assert response.status_code == 200
+    body = response.json()
+    names = set(fields.split(",")) | {"meta"}
+    assert set(body) == names
+    for name in names:
+        assert body[name] == full[name], name
+
+
+def test_unrequested_tables_are_not_read(database):
+    seen = statements(database)
+    client.get("/data", params={"fields": "corrMatrix"})
+    tables = " ".join(seen)
+    assert "corr_matrix" in tables
+    assert "iqr_stats" not in tables and "partial_2025" not in tables
+    assert "decadal_anomaly" not in tables and "api_payload" not in tables
+    # meta's inputs, in their smallest form
+    daily = [sql for sql in seen if "daily_sea_ice" in sql]
+    assert daily and all("MAX" in sql for sql in daily)
+    annual = [sql for sql in seen if sql.endswith("FROM annual")]
+    assert annual == ['SELECT "Year", "Glob", "GlobalCO2Mean" FROM annual']
+
+
+@pytest.mark.parametrize("where", ["offline", "database"])
+def test_the_anomaly_is_computed_only_when_asked_for(request, where, monkeypatch):
+    request.getfixturevalue(where)
+
+    def fail(_rows):
+        raise AssertionError("decadal anomaly computed")
+
+    monkeypatch.setattr(main, "compute_decadal_daily_anomaly", fail)
+    assert client.get("/data", params={"fields": "corrMatrix,annual"}).status_code == 200
+
+
+def test_every_section_is_the_full_payload(offline):
+    full = client.get("/data")
+    every = client.get("/data", params={"fields": ",".join(main._DATA_FIELDS)})
+    assert every.headers["ETag"] == full.headers["ETag"]
+    assert every.content == full.content
+
+
+def test_selections_are_cached_apart(offline):
+    one = client.get("/data", params={"fields": "corrMatrix"})
+    other = client.get("/data", params={"fields": "iqrStats"})
+    assert one.headers["ETag"] != other.headers["ETag"]
+    again = client.get(
+        "/data",
+        params={"fields": "corrMatrix,meta"},
+        headers={"If-None-Match": one.headers["ETag"]},
+    )
+    assert again.status_code == 304
+
+
+def test_columnar_selection(offline):
+    body = client.get("/data", params={"fields": "iqrStats", "format": "columnar"}).json()
+    assert set(body) == {"format", "iqrStats", "meta"}
+    assert "q25" in body["iqrStats"]
+
+
+def test_unknown_fields_are_rejected(offline):
+    response = client.get("/data", params={"fields": "corrMatrix,everything"})
+    assert response.status_code == 422
+    assert "everything" in response.json()["detail"]
+
+
+def test_the_full_payload_keeps_its_strict_schema():
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+    assert {"annual", "dailySeaIce", "corrMatrix"} <= set(schemas["DataResponse"]["required"])
+    assert "required" not in schemas["DataResponseSelection"]
+    with pytest.raises(ValueError):
+        main._payload_content(main.DataResponse, {"corrMatrix": []})
+    assert main._payload_content(
+        main.DataResponseSelection, {"corrMatrix": [], "meta": {}}, frozenset({"corrMatrix", "meta"})
+    ) == {"corrMatrix": [], "meta": {}}
@@ -0,0 +1,126 @@
+"""The CSV fallback for /uummannaq is built once per CSV, not per request.
+
+Without a database or fjord_data.json every request used to parse the CSV with
+pandas and rerun every bootstrap and the freeze table.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+SOURCE_CSV = main._find_fjord_csv()
+pytestmark = pytest.mark.skipif(SOURCE_CSV is None, reason="no fjord CSV in this checkout")
+
+
+@pytest.fixture
+def csv_only(offline, tmp_path, monkeypatch):
+    csv_path = tmp_path / "summary_test_cleaned.csv"
+    shutil.copy(SOURCE_CSV, csv_path)
+    monkeypatch.setattr(main, "FJORD_CSV_CANDIDATES", [csv_path])
+    monkeypatch.setattr(main, "FJORD_DATA_FILE", tmp_path / "missing.json")
+    return csv_path
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+    original = main._fjord_payload_from_rows
+
+    def counting(rows):
+        calls.append(len(rows))
+        return original(rows)
+
+    monkeypatch.setattr(main, "_fjord_payload_from_rows", counting)
+    return calls
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_every_view_shares_one_build(csv_only, builds):
+    first = client.get("/uummannaq")
+    assert first.status_code == 200
+    assert first.headers["X-Climate-Data-Source"] == "csv-fallback"
+    assert client.get("/uummannaq", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+    assert client.get("/uummannaq", params={"format": "columnar"}).status_code == 200
+    assert client.get("/uummannaq/daily.arrow", params={"max_points": 50}).status_code == 200
+    assert len(builds) == 1
+
+
+def test_the_sidecar_holds_the_parsed_rows(csv_only):
+    parsed = main._read_fjord_csv(csv_only)
+    sidecars = list(main.FJORD_CSV_SIDECAR_DIR.glob("*.npz"))
+    assert len(sidecars) == 1
+    from_sidecar = main._read_fjord_csv(csv_only)
+    pd.testing.assert_frame_equal(
+        from_sidecar, parsed.assign(date=parsed["date"].dt.tz_localize(None)), check_dtype=False
+    )
+
+
+def test_a_new_process_skips_the_csv_parse(csv_only, monkeypatch):
+    built = main._build_fjord_payload_from_csv()
+    main._invalidate_payload_cache()
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("parsed the CSV despite a sidecar")
+
+    monkeypatch.setattr(main.pd, "read_csv", no_parse)
+    rebuilt = main._build_fjord_payload_from_csv()
+    built.pop("meta"), rebuilt.pop("meta")
+    assert rebuilt == built
+
+
+def test_a_touched_csv_keeps_its_sidecar(csv_only, builds, monkeypatch):
+    client.get("/uummannaq")
+    _touch(csv_only)
+    monkeypatch.setattr(main.pd, "read_csv", lambda *a, **k: pytest.fail("parsed the CSV"))
+    assert client.get("/uummannaq").status_code == 200
+    assert len(builds) == 2
+
+
+def test_an_edited_csv_is_parsed_again(csv_only, builds):
+    before = client.get("/uummannaq").json()
+    rows = pd.read_csv(csv_only)
+    rows = rows[rows["year"] != rows["year"].max()]
+    rows.to_csv(csv_only, index=False)
+    _touch(csv_only)
+
+    after = client.get("/uummannaq").json()
+    assert len(builds) == 2
+    assert after["freeze"] == before["freeze"][:-1]
+    assert len(list(main.FJORD_CSV_SIDECAR_DIR.glob("*.npz"))) == 1
+
+
+def test_a_slow_build_of_an_edited_csv_is_waited_for(csv_only, builds, monkeypatch):
+    before = client.get("/uummannaq").json()
+    rows = pd.read_csv(csv_only)
+    rows = rows[rows["year"] != rows["year"].max()]
+    rows.to_csv(csv_only, index=False)
+    _touch(csv_only)
+    # far slower than the stale threshold; the old CSV's payload must not answer
+    monkeypatch.setattr(main.settings, "payload_stale_after_seconds", 0.01)
+    original = main._read_fjord_csv
+    monkeypatch.setattr(main, "_read_fjord_csv", lambda path: time.sleep(0.3) or original(path))
+
+    response = client.get("/uummannaq")
+    assert response.headers["X-Climate-Stale"] == "false"
+    assert response.json()["freeze"] == before["freeze"][:-1]
+
+
+def test_an_unwritable_sidecar_dir_only_costs_the_parse(csv_only, monkeypatch, tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(main, "FJORD_CSV_SIDECAR_DIR", blocker / "sidecars")
+    assert client.get("/uummannaq").status_code == 200
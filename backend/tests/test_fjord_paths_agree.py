@@ -24,7 +24,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from main import _season_sampling_error
+from main import _season_sampling_errors
 
 MAIN = Path(__file__).resolve().parents[1] / "main.py"
 SOURCE = MAIN.read_text()
@@ -41,6 +41,10 @@ def _season(year: int, raw: list[float | None]) -> pd.DataFrame:
     )
 
 
+def _season_sampling_error(rows: pd.DataFrame, year: int) -> dict:
+    return _season_sampling_errors(rows, [year])[year]
+
+
 class TestSamplingError:
     def test_counts_only_measured_days(self) -> None:
         # Five days in the window, two of them gap filled. The interval has to
@@ -85,7 +89,9 @@ class TestBothBranchesAgree:
     """
 
     def test_both_branches_attach_the_sampling_error(self) -> None:
-        calls = len(re.findall(r"_season_sampling_error\(", SOURCE))
+        # _season_sampling_errors answers for every season at once, exactly as
+        # the per-season definition in test_sampling_errors.py does
+        calls = len(re.findall(r"_season_sampling_errors\(", SOURCE))
         # one definition, one call in the CSV branch, one in the database branch
         assert calls >= 3, (
             "the sampling error is attached in fewer places than there are "
@@ -110,7 +116,7 @@ class TestOneBreakupDefinition:
 
     The database branch used to read these out of fjord_freeze_breakup, which the
     data pipeline fills with min and max of the days above the threshold. That is
-    the definition _freeze_and_breakup was written to replace, and production
+    the definition _freeze_and_breakup_all was written to replace, and production
     served it while the CSV fallback served the careful one. On this data the two
     land within a day of each other every season, so the only visible symptom was
     the badge reading 29 Apr under prose that says the earliest break-up in the
@@ -126,13 +132,47 @@ class TestOneBreakupDefinition:
         )
 
     def test_both_branches_go_through_the_same_helper(self) -> None:
-        # one definition, one call in each branch
-        assert len(re.findall(r"_freeze_and_breakup\(", SOURCE)) >= 2
+        # one definition, one call in each branch; _freeze_table runs
+        # _freeze_and_breakup_all over every season at once, and
+        # test_freeze_breakup_all.py holds it to the per-season definition
+        assert len(re.findall(r"_freeze_table\(", SOURCE)) >= 3
+        assert len(re.findall(r"_freeze_and_breakup_all\(", SOURCE)) >= 2
 
     def test_the_helper_needs_a_sustained_open_run(self) -> None:
         # The naive definition is max(doy where frozen). If the helper ever
         # collapses to that, 2025 goes back to breaking up on 8 March, before
-        # its ice had arrived.
-        start = SOURCE.index("def _freeze_and_breakup")
-        body = SOURCE[start : SOURCE.index("\ndef ", start + 10)]
-        assert "_first_run_start" in body and "_sustained_runs" in body
+        # its ice had arrived: a single open day inside the winter must neither
+        # end it nor count as break-up.
+        from main import _freeze_and_breakup_all
+
+        values = [0.9] * 30 + [0.02] * 20 + [0.9] + [0.02] * 20
+        rows = pd.DataFrame(
+            {"year": 2025, "doy": range(45, 45 + len(values)), "frac": values}
+        )
+        assert _freeze_and_breakup_all(rows)[2025] == (45, 75)
+
+
+class TestThePublishedPayloadAgrees:
+    """The pipeline's prebuilt /uummannaq payload is a third way in.
+
+    It deliberately carries neither the break-up dates nor the sampling error,
+    so the one definition of each stays in main.py. What the API attaches to it
+    has to come out exactly as the CSV branch computes it.
+    """
+
+    def test_completing_the_published_payload_matches_the_csv_branch(self) -> None:
+        import main
+
+        built = main._build_fjord_payload_from_csv()
+        if built is None:
+            pytest.skip("no fjord CSV in this checkout")
+        published = {
+            "spring": built["spring"],
+            "season": built["season"],
+            "frac": [{"year": r["year"], "mean": r["mean"]} for r in built["frac"]],
+            "daily": built["daily"],
+            "seasonLossPct": built["seasonLossPct"],
+        }
+        completed = main._complete_published_fjord_payload(published)
+        assert completed["frac"] == built["frac"]
+        assert completed["freeze"] == sorted(built["freeze"], key=lambda r: r["year"])
@@ -0,0 +1,160 @@
+"""The season band comes out of one aggregation as it did out of 256 filters.
+
+update_fjord_data.py (and the API's CSV branch alike) filtered the whole record
+once per day of the sun window and period. The references below are those
+loops, kept to hold the grouped versions to the same output: exactly on the
+shipped record and on small random ones, to the last bits of a float where a
+period has eight or more seasons and NumPy starts summing pairwise.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+
+PIPELINE = Path(__file__).resolve().parents[2] / "data-pipeline"
+sys.path.insert(0, str(PIPELINE))
+
+import update_fjord_data  # noqa: E402
+
+
+def pipeline_loop(rows, early_yrs, late_yrs) -> pd.DataFrame:
+    mean = lambda s: float(s.mean()) if len(s) else None  # noqa: E731
+    pct = lambda s, q: float(s.quantile(q)) if len(s) else None  # noqa: E731
+    records = []
+    for doy in range(update_fjord_data.SUN_START, update_fjord_data.SUN_END + 1):
+        for period, years in [("early", early_yrs), ("late", late_yrs)]:
+            vals = rows.query("year in @years and doy == @doy")["frac"]
+            records.append({
+                "doy": doy,
+                "period": period,
+                "mean": mean(vals),
+                "p25": pct(vals, 0.25),
+                "p75": pct(vals, 0.75),
+            })
+    return pd.DataFrame(records)
+
+
+def api_loop(rows, early_years, late_years) -> list[dict]:
+    def measured(years, doy):
+        values = rows[(rows["year"].isin(years)) & (rows["doy"] == doy)]["frac"]
+        return pd.to_numeric(values, errors="coerce").dropna()
+
+    def mean(values):
+        return float(values.mean()) if len(values) else None
+
+    def quantile(values, q):
+        return float(values.quantile(q)) if len(values) else None
+
+    season = []
+    for doy in range(main.FJORD_SUN_START, main.FJORD_SUN_END + 1):
+        early, late = measured(early_years, doy), measured(late_years, doy)
+        season.append({
+            "day": main._label_for_doy(doy),
+            "eMean": mean(early),
+            "e25": quantile(early, 0.25),
+            "e75": quantile(early, 0.75),
+            "lMean": mean(late),
+            "l25": quantile(late, 0.25),
+            "l75": quantile(late, 0.75),
+        })
+    return season
+
+
+def random_record(seed: int, first_year: int, last_year: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for year in range(first_year, last_year + 1):
+        doys = np.arange(30, 200)
+        doys = doys[rng.random(len(doys)) > 0.2]  # days missing from the record
+        frac = rng.random(len(doys))
+        frac[rng.random(len(doys)) < 0.1] = np.nan  # days without a value
+        frames.append(pd.DataFrame({"year": year, "doy": doys, "frac": frac}))
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture(scope="module")
+def shipped():
+    csv_path = main._find_fjord_csv()
+    if csv_path is None:
+        pytest.skip("no fjord CSV in this checkout")
+    return main._parse_fjord_csv(csv_path)
+
+
+# --- update_fjord_data.py -------------------------------------------------------
+
+
+def test_the_pipeline_band_matches_on_the_shipped_record(shipped):
+    early, late = update_fjord_data.year_groups(shipped["year"])
+    pd.testing.assert_frame_equal(
+        update_fjord_data.season_band(shipped, early, late),
+        pipeline_loop(shipped, early, late),
+        check_exact=True,
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_the_pipeline_band_matches_on_random_records(seed):
+    rows = random_record(seed, 2017, 2026)
+    early, late = update_fjord_data.year_groups(rows["year"])
+    pd.testing.assert_frame_equal(
+        update_fjord_data.season_band(rows, early, late),
+        pipeline_loop(rows, early, late),
+        check_exact=True,
+        check_dtype=False,
+    )
+
+
+def test_the_pipeline_band_holds_with_many_seasons():
+    rows = random_record(7, 2017, 2060)
+    early, late = update_fjord_data.year_groups(rows["year"])
+    pd.testing.assert_frame_equal(
+        update_fjord_data.season_band(rows, early, late),
+        pipeline_loop(rows, early, late),
+        rtol=1e-12,
+        check_dtype=False,
+    )
+
+
+def test_a_window_without_values_gives_an_empty_pipeline_band():
+    rows = pd.DataFrame({"year": [2018, 2022], "doy": [10, 200], "frac": [0.5, 0.5]})
+    early, late = update_fjord_data.year_groups(rows["year"])
+    band = update_fjord_data.season_band(rows, early, late)
+    assert len(band) == 2 * (update_fjord_data.SUN_END - update_fjord_data.SUN_START + 1)
+    assert band[["mean", "p25", "p75"]].isna().all().all()
+
+
+# --- backend/main.py CSV branch -------------------------------------------------
+
+
+def test_the_api_band_matches_on_the_shipped_record(shipped):
+    early, late = main._fjord_year_groups(shipped["year"])
+    assert main._fjord_season_band(shipped, early, late) == api_loop(shipped, early, late)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_the_api_band_matches_on_random_records(seed):
+    rows = random_record(seed, 2017, 2026)
+    early, late = main._fjord_year_groups(rows["year"])
+    assert main._fjord_season_band(rows, early, late) == api_loop(rows, early, late)
+
+
+def test_the_api_band_holds_with_many_seasons():
+    rows = random_record(7, 2017, 2060)
+    early, late = main._fjord_year_groups(rows["year"])
+    for got, expected in zip(main._fjord_season_band(rows, early, late), api_loop(rows, early, late)):
+        assert got == pytest.approx(expected, rel=1e-12)
+
+
+def test_an_empty_record_has_an_empty_band():
+    rows = pd.DataFrame({"year": [], "doy": [], "frac": []})
+    band = main._fjord_season_band(rows, [], [])
+    assert len(band) == main.FJORD_SUN_END - main.FJORD_SUN_START + 1
+    assert {row["eMean"] for row in band} == {None}
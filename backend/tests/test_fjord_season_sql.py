@@ -0,0 +1,118 @@
+"""The season band is pivoted by the database, as the Python loop did it.
+
+_read_fjord_tables used to read every fjord_season_band row and pivot early
+and late per day in a dict, then loop again for seasonLossPct. The reference
+below is that code, kept to hold the single query to the same answer.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+import main
+
+
+def python_pivot(season_rows):
+    by_doy: dict[int, dict[str, dict]] = {}
+    for r in season_rows:
+        by_doy.setdefault(r["doy"], {})[r["period"]] = r
+    merged = []
+    for doy in sorted(by_doy.keys()):
+        early = by_doy[doy].get("early")
+        late = by_doy[doy].get("late")
+        merged.append({
+            "day": main._label_for_doy(doy),
+            "eMean": early["mean"] if early else None,
+            "e25": early["p25"] if early else None,
+            "e75": early["p75"] if early else None,
+            "lMean": late["mean"] if late else None,
+            "l25": late["p25"] if late else None,
+            "l75": late["p75"] if late else None,
+        })
+    e_sum = l_sum = 0.0
+    paired = 0
+    for row in merged:
+        e, l = row["eMean"], row["lMean"]
+        if e is not None and l is not None:
+            e_sum += e
+            l_sum += l
+            paired += 1
+    loss = round((1 - (l_sum / e_sum)) * 100, 1) if paired and e_sum > 0 else None
+    return merged, loss
+
+
+def band(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    records = []
+    for doy in range(main.FJORD_SUN_START, main.FJORD_SUN_END + 1):
+        for period in ("early", "late"):
+            if rng.random() < 0.05:
+                continue  # a day one period never observed
+            mean = None if rng.random() < 0.05 else float(rng.random())
+            records.append({
+                "doy": doy,
+                "period": period,
+                "mean": mean,
+                "p25": None if mean is None else mean * 0.8,
+                "p75": None if mean is None else min(1.0, mean * 1.2),
+            })
+    return pd.DataFrame(records).sample(frac=1.0, random_state=seed)
+
+
+def stored(engine, frame):
+    frame.to_sql("fjord_season_band", engine, index=False)
+    return engine
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_the_query_pivots_like_the_loop(sqlite_database, seed):
+    engine = stored(sqlite_database, band(seed))
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT * FROM fjord_season_band")).mappings().all()
+        merged, loss = main._read_fjord_season(conn)
+    expected_merged, expected_loss = python_pivot(rows)
+    assert merged == expected_merged
+    assert loss == pytest.approx(expected_loss, abs=0.1)
+
+
+def test_the_shipped_band(sqlite_database):
+    csv_path = main._find_fjord_csv()
+    if csv_path is None:
+        pytest.skip("no fjord CSV in this checkout")
+    payload = main._fjord_payload_from_rows(main._parse_fjord_csv(csv_path))
+    records = []
+    doys = range(main.FJORD_SUN_START, main.FJORD_SUN_END + 1)
+    for doy, row in zip(doys, payload["season"]):
+        for period, prefix, mean in (("early", "e", "eMean"), ("late", "l", "lMean")):
+            records.append({
+                "doy": doy,
+                "period": period,
+                "mean": row[mean],
+                "p25": row[f"{prefix}25"],
+                "p75": row[f"{prefix}75"],
+            })
+    engine = stored(sqlite_database, pd.DataFrame(records))
+    with engine.connect() as conn:
+        merged, loss = main._read_fjord_season(conn)
+    assert merged == payload["season"]
+    assert loss == payload["seasonLossPct"]
+
+
+def test_no_paired_days_no_loss(sqlite_database):
+    frame = pd.DataFrame([
+        {"doy": 60, "period": "early", "mean": 0.9, "p25": 0.8, "p75": 1.0},
+        {"doy": 61, "period": "late", "mean": 0.2, "p25": 0.1, "p75": 0.3},
+    ])
+    with stored(sqlite_database, frame).connect() as conn:
+        merged, loss = main._read_fjord_season(conn)
+    assert [row["eMean"] for row in merged] == [0.9, None]
+    assert loss is None
+
+
+def test_an_empty_band(sqlite_database):
+    frame = pd.DataFrame({"doy": [], "period": [], "mean": [], "p25": [], "p75": []})
+    with stored(sqlite_database, frame).connect() as conn:
+        assert main._read_fjord_season(conn) == ([], None)
@@ -18,11 +18,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from main import (  # noqa: E402
-    FJORD_PERSISTENCE_DAYS,
-    _first_run_start,
-    _freeze_and_breakup,
-)
+from main import FJORD_PERSISTENCE_DAYS, _freeze_and_breakup_all  # noqa: E402
 
 
 def season(values, start_doy: int = 45) -> pd.DataFrame:
@@ -31,23 +27,9 @@ def season(values, start_doy: int = 45) -> pd.DataFrame:
     )
 
 
-# --- the run finder -------------------------------------------------------
-
-
-def test_first_run_start_finds_the_beginning_not_the_end():
-    assert _first_run_start([False, True, True, True], 3) == 1
-
-
-def test_first_run_start_ignores_runs_that_are_too_short():
-    assert _first_run_start([True, True, False, True, True, True], 3) == 3
-
-
-def test_first_run_start_returns_none_without_a_long_enough_run():
-    assert _first_run_start([True, False, True, False], 3) is None
-
-
-def test_first_run_start_handles_an_empty_season():
-    assert _first_run_start([], 3) is None
+def _freeze_and_breakup(group: pd.DataFrame, **kwargs):
+    """The dates _freeze_and_breakup_all gives `group` as a season of its own."""
+    return _freeze_and_breakup_all(group.assign(year=2020), **kwargs).get(2020, (None, None))
 
 
 # --- freeze and break-up --------------------------------------------------
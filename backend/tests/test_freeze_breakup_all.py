@@ -0,0 +1,199 @@
+"""_freeze_and_breakup_all gives _freeze_and_breakup's answer for every season.
+
+The vectorised version is what the routes serve; the per-season one below is
+the definition it replaced, kept here unchanged because it is easier to read
+and argue about. Random seasons are drawn so that
+every rule gets exercised: short cold snaps, gaps shorter and longer than the
+persistence window, missing values, days missing from the series, ties between
+equally long winters, and seasons that never freeze or never open.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from main import (
+    FJORD_PERSISTENCE_DAYS,
+    FJORD_THRESHOLD,
+    _freeze_and_breakup_all,
+    _freeze_table,
+)
+
+# --- the per-season definition, unchanged ---
+
+
+def _first_run_start(flags: list[bool], need: int) -> Optional[int]:
+    """Index where the first run of `need` consecutive True values begins."""
+    run = 0
+    for i, flag in enumerate(flags):
+        run = run + 1 if flag else 0
+        if run >= need:
+            return i - need + 1
+    return None
+
+
+def _sustained_runs(flags: list[bool], need: int) -> list[tuple[int, int]]:
+    """Every maximal run of at least `need` consecutive True values, as (start, end)."""
+    runs: list[tuple[int, int]] = []
+    i = 0
+    while i < len(flags):
+        if not flags[i]:
+            i += 1
+            continue
+        j = i
+        while j < len(flags) and flags[j]:
+            j += 1
+        if j - i >= need:
+            runs.append((i, j - 1))
+        i = j
+    return runs
+
+
+def _close_short_gaps(flags: list[bool], need: int) -> list[bool]:
+    """Fill interruptions shorter than `need`, so one cloudy day cannot split a winter.
+
+    Without this, picking the longest frozen spell would date freeze-up from
+    whichever side of a single misread day happened to be longer.
+    """
+    closed = list(flags)
+    i = 0
+    while i < len(flags):
+        if flags[i]:
+            i += 1
+            continue
+        j = i
+        while j < len(flags) and not flags[j]:
+            j += 1
+        interior = i > 0 and j < len(flags)
+        if interior and (j - i) < need:
+            for k in range(i, j):
+                closed[k] = True
+        i = j
+    return closed
+
+
+def _freeze_and_breakup(
+    group: "pd.DataFrame",
+    threshold: float = FJORD_THRESHOLD,
+    need: int = FJORD_PERSISTENCE_DAYS,
+) -> tuple[Optional[int], Optional[int]]:
+    """Start of the main frozen spell, and the first sustained open day after it."""
+    ordered = group.sort_values("doy")
+    doys = [int(d) for d in ordered["doy"].tolist()]
+    values = ordered["frac"].tolist()
+
+    frozen = [bool(v is not None and not pd.isna(v) and v >= threshold) for v in values]
+    winters = _sustained_runs(_close_short_gaps(frozen, need), need)
+    if not winters:
+        return None, None
+
+    start, end = max(winters, key=lambda run: run[1] - run[0])
+
+    open_after = [
+        bool(v is not None and not pd.isna(v) and v < threshold)
+        for v in values[end + 1 :]
+    ]
+    thaw = _first_run_start(open_after, need)
+    return doys[start], (doys[end + 1 + thaw] if thaw is not None else None)
+
+
+def test_first_run_start_finds_the_beginning_not_the_end():
+    assert _first_run_start([False, True, True, True], 3) == 1
+
+
+def test_first_run_start_ignores_runs_that_are_too_short():
+    assert _first_run_start([True, True, False, True, True, True], 3) == 3
+
+
+def test_first_run_start_returns_none_without_a_long_enough_run():
+    assert _first_run_start([True, False, True, False], 3) is None
+
+
+def test_first_run_start_handles_an_empty_season():
+    assert _first_run_start([], 3) is None
+
+
+# --- the vectorised version against it ---
+
+
+def per_season(rows, **kwargs):
+    return {int(year): _freeze_and_breakup(group, **kwargs) for year, group in rows.groupby("year")}
+
+
+def random_season(rng, year: int) -> pd.DataFrame:
+    length = int(rng.integers(0, 140))
+    # blocks of ice and open water of random length, so runs near the
+    # persistence window are common rather than rare
+    values = []
+    while len(values) < length:
+        level = rng.choice([0.9, 0.05, np.nan], p=[0.45, 0.45, 0.1])
+        values.extend([level] * int(rng.integers(1, 2 * FJORD_PERSISTENCE_DAYS)))
+    values = np.array(values[:length], dtype=float)
+    values += rng.normal(0, 0.05, length)
+    doys = np.arange(30, 30 + length)
+    keep = rng.random(length) > 0.1  # days missing from the series entirely
+    return pd.DataFrame({"year": year, "doy": doys[keep], "frac": values[keep]})
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_seasons_agree(seed):
+    rng = np.random.default_rng(seed)
+    rows = pd.concat([random_season(rng, 2000 + y) for y in range(12)], ignore_index=True)
+    rows = rows.sample(frac=1.0, random_state=seed)  # arrival order must not matter
+    assert _freeze_and_breakup_all(rows) == per_season(rows)
+
+
+@pytest.mark.parametrize("need", [1, 2, 3, 7, 15])
+@pytest.mark.parametrize("threshold", [0.15, 0.5])
+def test_the_parameters_carry_through(need, threshold):
+    rng = np.random.default_rng(need * 100 + int(threshold * 100))
+    rows = pd.concat([random_season(rng, 2000 + y) for y in range(8)], ignore_index=True)
+    assert _freeze_and_breakup_all(rows, threshold=threshold, need=need) == per_season(
+        rows, threshold=threshold, need=need
+    )
+
+
+EDGE_CASES = {
+    "empty season": [],
+    "one day": [0.9],
+    "never freezes": [0.02] * 40,
+    "never opens": [0.9] * 40,
+    "all missing": [np.nan] * 20,
+    "exactly the window": [0.9] * FJORD_PERSISTENCE_DAYS,
+    "one short of the window": [0.9] * (FJORD_PERSISTENCE_DAYS - 1) + [0.02] * 20,
+    "two equal winters": [0.9] * 10 + [0.02] * 10 + [0.9] * 10 + [0.02] * 10,
+    "gap at the start": [0.02] * 3 + [0.9] * 20 + [0.02] * 10,
+    "gap at the end": [0.9] * 20 + [0.02] * 3,
+    "gap of exactly the window": [0.9] * 10 + [0.02] * FJORD_PERSISTENCE_DAYS + [0.9] * 10,
+    "missing inside the thaw": [0.9] * 20 + [0.02] * 4 + [np.nan] + [0.02] * 10,
+    "on the threshold": [0.15] * 10 + [0.1499] * 10,
+}
+
+
+@pytest.mark.parametrize("values", EDGE_CASES.values(), ids=EDGE_CASES.keys())
+def test_edge_cases_agree(values):
+    season = pd.DataFrame({"year": 2020, "doy": range(45, 45 + len(values)), "frac": values})
+    # beside a long season, so this one is padded in the array
+    longest = pd.DataFrame({"year": 2021, "doy": range(1, 200), "frac": [0.9] * 100 + [0.0] * 99})
+    rows = pd.concat([season, longest], ignore_index=True)
+    assert _freeze_and_breakup_all(rows) == per_season(rows)
+
+
+def test_missing_frac_values_may_arrive_as_none():
+    rows = pd.DataFrame({"year": 2020, "doy": range(1, 31), "frac": [0.9] * 15 + [None] + [0.0] * 14})
+    assert _freeze_and_breakup_all(rows) == per_season(rows)
+
+
+def test_no_rows_no_seasons():
+    assert _freeze_and_breakup_all(pd.DataFrame({"year": [], "doy": [], "frac": []})) == {}
+
+
+def test_the_table_is_sorted_by_year():
+    rows = pd.DataFrame(
+        {"year": [2022] * 20 + [2019] * 20, "doy": list(range(20)) * 2, "frac": [0.9] * 40}
+    )
+    assert [r["year"] for r in _freeze_table(rows)] == [2019, 2022]
@@ -0,0 +1,134 @@
+"""/data is built once per data version, not once per request.
+
+The data changes once a day. Every request used to re-read it, recompute the
+decadal anomaly and rebuild the meta block anyway. These pin the cache that
+replaced that, and the ETag that lets a repeat visitor skip the body entirely.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def data_file(offline, tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    shutil.copy(main.DATA_FILE, path)
+    monkeypatch.setattr(main, "DATA_FILE", path)
+    return path
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    # every body build attaches a fresh meta block; the parsed file and its
+    # decadal anomaly are held per file version below the body cache
+    calls = []
+    original = main._attach_data_meta
+
+    def counting(data, **kwargs):
+        calls.append(len(data.get("dailySeaIce", [])))
+        return original(data, **kwargs)
+
+    monkeypatch.setattr(main, "_attach_data_meta", counting)
+    return calls
+
+
+def test_repeat_requests_are_served_from_the_cache(data_file, builds):
+    first = client.get("/data")
+    second = client.get("/data")
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert len(builds) == 1
+
+
+def test_a_matching_etag_gets_304_without_a_body(data_file):
+    first = client.get("/data")
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    again = client.get("/data", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    assert again.headers["x-climate-data-source"] == "json-fallback"
+
+
+def test_a_weak_or_listed_etag_still_matches(data_file):
+    etag = client.get("/data").headers["etag"]
+    assert client.get("/data", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get("/data", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+    assert client.get("/data", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_a_new_file_version_invalidates_the_cache(data_file, builds):
+    client.get("/data")
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    client.get("/data")
+    assert len(builds) == 2
+
+
+def test_the_cache_rolls_over_at_midnight(data_file, builds, monkeypatch):
+    # ageDays in the freshness block is measured from today, so a body built
+    # yesterday must not be served today.
+    client.get("/data")
+    monkeypatch.setattr(main, "_utc_today", lambda: date(2099, 1, 1))
+    client.get("/data")
+    assert len(builds) == 2
+
+
+def test_the_cached_body_matches_the_response_model(data_file):
+    payload = client.get("/data").json()
+    assert set(payload) == set(main.DataResponse.model_fields)
+    # undeclared keys in data.json are dropped, as response_model always did
+    assert "pipelineWarnings" not in payload
+
+
+def test_a_published_payload_is_read_from_one_row(sqlite_database):
+    import gzip
+    import json
+
+    from sqlalchemy import text
+
+    engine = sqlite_database
+    body = json.dumps({"annual": [], "dailySeaIce": [{"Year": 2026, "DayOfYear": 60, "Extent": 14.1}]})
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE api_payload (route text, version text, body text, body_gzip blob, "
+            "PRIMARY KEY (route, version))"
+        ))
+        conn.execute(
+            text("INSERT INTO api_payload VALUES ('/data', 'v1', :body, :gz)"),
+            {"body": body, "gz": gzip.compress(body.encode())},
+        )
+    with engine.connect() as conn:
+        assert main._published_payload(conn, "/data", "v1") == json.loads(body)
+        assert main._published_payload(conn, "/data", "v0") is None
+        assert main._published_payload(conn, "/data", None) is None
+
+
+def test_a_missing_payload_table_is_not_an_error(sqlite_database):
+    with sqlite_database.connect() as conn:
+        assert main._published_payload(conn, "/data", "v1") is None
+        assert main._published_version(conn, "data") is None
+
+
+def test_slimmed_daily_rows_still_date_the_latest_observation():
+    # The pipeline publishes dailySeaIce without DateStr; freshness must still
+    # know which day the newest row is.
+    data = {"dailySeaIce": [
+        {"Year": 2026, "DayOfYear": 59, "Extent": 14.0},
+        {"Year": 2026, "DayOfYear": 60, "Extent": 14.1},
+    ]}
+    meta = main._attach_data_meta(data)["meta"]
+    assert meta["latestSeaIceDate"] == "2026-03-01"
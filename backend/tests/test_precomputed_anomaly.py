@@ -0,0 +1,123 @@
+"""/data serves the pipeline's decadal anomaly when it was computed like ours.
+
+update_pipeline.py computes the anomaly once per run, stamped with the seaice_*
+parameters it used. The pipeline and the API are configured separately, so the
+stamp is what makes the stored copy safe to serve: on a mismatch, or with no
+table at all, the API computes the anomaly itself as it always did.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from settings import Settings
+
+PIPELINE = Path(__file__).resolve().parents[2] / "data-pipeline"
+sys.path.insert(0, str(PIPELINE))
+
+import update_pipeline  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def daily_rows():
+    return json.loads(main.DATA_FILE.read_text())["dailySeaIce"]
+
+
+@pytest.fixture
+def pipeline_env(monkeypatch):
+    for env_var, _ in update_pipeline.DECADAL_ANOMALY_SETTINGS.values():
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.setattr(main, "settings", Settings())
+
+
+@pytest.fixture
+def stored(sqlite_database, daily_rows, pipeline_env):
+    """A database holding what the pipeline writes, plus the engine."""
+    params = update_pipeline.decadal_anomaly_params()
+    records = update_pipeline.compute_decadal_daily_anomaly(daily_rows, params)
+    (
+        pd.DataFrame(records)
+        .assign(params=update_pipeline.decadal_anomaly_fingerprint(params))
+        .to_sql("decadal_anomaly", sqlite_database, index=False)
+    )
+    return sqlite_database, records
+
+
+# --- one definition, two services ---------------------------------------------
+
+
+def test_both_sides_fingerprint_the_defaults_alike(pipeline_env):
+    params = update_pipeline.decadal_anomaly_params()
+    assert update_pipeline.decadal_anomaly_fingerprint(params) == main._decadal_anomaly_fingerprint()
+
+
+def test_the_fingerprint_follows_the_environment(pipeline_env, monkeypatch):
+    before = update_pipeline.decadal_anomaly_fingerprint(update_pipeline.decadal_anomaly_params())
+    monkeypatch.setenv("SEAICE_SMOOTH_WINDOW", "11")
+    after = update_pipeline.decadal_anomaly_fingerprint(update_pipeline.decadal_anomaly_params())
+    assert after != before
+    monkeypatch.setattr(main, "settings", Settings())
+    assert main._decadal_anomaly_fingerprint() == after
+
+
+def test_the_pipeline_computes_what_the_api_would(daily_rows, pipeline_env):
+    params = update_pipeline.decadal_anomaly_params()
+    expected = main.compute_decadal_daily_anomaly(daily_rows)
+    assert json.dumps(update_pipeline.compute_decadal_daily_anomaly(daily_rows, params)) == json.dumps(expected)
+
+
+# --- reading it back ------------------------------------------------------------
+
+
+def test_a_matching_table_is_served(stored):
+    engine, records = stored
+    with engine.connect() as conn:
+        assert main._precomputed_decadal_anomaly(conn, {}) == records
+
+
+def test_a_mismatched_table_is_ignored(stored, monkeypatch):
+    engine, _ = stored
+    monkeypatch.setattr(main, "settings", Settings(seaice_decadal_smooth=9))
+    with engine.connect() as conn:
+        assert main._precomputed_decadal_anomaly(conn, {}) is None
+
+
+def test_a_missing_table_is_not_an_error(sqlite_database, pipeline_env):
+    with sqlite_database.connect() as conn:
+        assert main._precomputed_decadal_anomaly(conn, {}) is None
+
+
+def test_a_published_payload_carries_its_own_stamp(pipeline_env):
+    fingerprint = main._decadal_anomaly_fingerprint()
+    rows = [{"decade": "2020s", "day": 1, "an": -1.0, "sd": 0.1, "n": 5}]
+
+    data = {"decadalAnomaly": rows, "decadalAnomalyParams": fingerprint}
+    assert main._precomputed_decadal_anomaly(None, data) == rows
+    assert "decadalAnomalyParams" not in data
+
+    data = {"decadalAnomaly": rows, "decadalAnomalyParams": "v0;something-else"}
+    assert main._precomputed_decadal_anomaly(None, data) is None
+    assert "decadalAnomaly" not in data
+
+
+def test_data_skips_the_computation_when_the_table_matches(stored, monkeypatch, daily_rows):
+    engine, records = stored
+    for key, (table, _) in main._DATA_TABLES.items():
+        rows = daily_rows[-400:] if key == "dailySeaIce" else [{"placeholder": 0}]
+        pd.DataFrame(rows).to_sql(table, engine, index=False)
+
+    def must_not_run(rows):
+        raise AssertionError("recomputed despite a matching decadal_anomaly table")
+
+    monkeypatch.setattr(main, "compute_decadal_daily_anomaly", must_not_run)
+    response = TestClient(main.app).get("/data")
+    assert response.status_code == 200
+    assert response.headers["X-Climate-Db-Status"] == "ok"
+    assert response.json()["decadalAnomaly"] == records
@@ -0,0 +1,84 @@
+"""Concurrent cache misses share one build instead of each running their own."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import main
+
+
+pytestmark = pytest.mark.usefixtures("offline")
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Counts payload builds, each held open long enough for a crowd to gather."""
+    lock = threading.Lock()
+    count = {"n": 0}
+    store = main._store_payloads
+
+    def slow_store(*args, **kwargs):
+        with lock:
+            count["n"] += 1
+        time.sleep(0.3)
+        return store(*args, **kwargs)
+
+    monkeypatch.setattr(main, "_store_payloads", slow_store)
+    return count
+
+
+async def crowd(requests: list[tuple[str, dict]]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.get(path, params=params) for path, params in requests)
+        )
+
+
+def test_hundreds_of_misses_build_once(builds):
+    responses = asyncio.run(crowd([("/data", {})] * 300))
+    assert builds["n"] == 1
+    assert {r.status_code for r in responses} == {200}
+    assert len({r.headers["ETag"] for r in responses}) == 1
+
+
+def test_each_route_and_selection_builds_once(builds):
+    requests = (
+        [("/data", {})] * 50
+        + [("/data", {"fields": "corrMatrix"})] * 50
+        + [("/data", {"fields": "corrMatrix,meta"})] * 50
+    )
+    responses = asyncio.run(crowd(requests))
+    assert builds["n"] == 2
+    assert {r.status_code for r in responses} == {200}
+
+
+def test_another_format_comes_from_the_shared_build(builds):
+    requests = [("/data", {})] * 40 + [("/data", {"format": "columnar"})] * 40
+    responses = asyncio.run(crowd(requests))
+    assert builds["n"] == 1
+    assert {r.json().get("format") for r in responses[40:]} == {"columnar"}
+
+
+def test_a_failed_build_fails_everyone_waiting(monkeypatch):
+    calls = []
+
+    def broken(path):
+        calls.append(path)
+        time.sleep(0.3)
+        raise ValueError("truncated file")
+
+    monkeypatch.setattr(main, "_read_json", broken)
+    responses = asyncio.run(crowd([("/data", {})] * 100))
+    assert len(calls) == 1
+    assert {r.status_code for r in responses} == {500}
+    assert main._IN_FLIGHT == {}
+
+    # and the next request starts afresh
+    monkeypatch.setattr(main, "_read_json", lambda path: main.orjson.loads(path.read_bytes()))
+    assert asyncio.run(crowd([("/data", {})]))[0].status_code == 200
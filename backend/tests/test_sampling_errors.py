@@ -0,0 +1,120 @@
+"""_season_sampling_errors answers exactly as _season_sampling_error, per year.
+
+The batched version is what the routes call; the per-season one below is the
+definition it replaced, kept here unchanged. Seeded per year, so a season's
+interval must not depend on which other seasons are in the frame or in what
+order the rows arrive.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+from main import _season_sampling_errors
+
+# --- the per-season definition, unchanged ---
+
+
+def _season_sampling_error(season_rows: "pd.DataFrame", year: int) -> dict[str, Any]:
+    """How much a season mean would move if different days had been observed."""
+    measured_column = "frac_raw" if "frac_raw" in season_rows.columns else "frac"
+    values = pd.to_numeric(
+        season_rows.loc[season_rows["year"] == year, measured_column], errors="coerce"
+    ).dropna()
+    observed = int(len(values))
+    if observed < 3:
+        return {"observedDays": observed, "standardError": None, "ci95": None}
+
+    sample = values.to_numpy()
+    generator = np.random.default_rng(seed=year)
+    draws = generator.choice(sample, size=(main.climate_stats.SEASON_BOOTSTRAP_DRAWS, observed))
+    means = draws.mean(axis=1)
+    return {
+        "observedDays": observed,
+        "measuredMean": round(float(sample.mean()), 4),
+        "standardError": round(float(means.std(ddof=1)), 4),
+        "ci95": [
+            round(float(np.percentile(means, 2.5)), 4),
+            round(float(np.percentile(means, 97.5)), 4),
+        ],
+    }
+
+
+# --- the batched version against it ---
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    main._SAMPLING_ERRORS.clear()
+    yield
+    main._SAMPLING_ERRORS.clear()
+
+
+def random_seasons(seed: int, years=range(2015, 2026)) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for year in years:
+        days = int(rng.integers(0, 70))
+        raw = rng.random(days)
+        raw[rng.random(days) < 0.4] = np.nan  # gap filled days
+        frames.append(
+            pd.DataFrame({"year": year, "doy": np.arange(53, 53 + days), "frac": 0.5, "frac_raw": raw})
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_every_season_matches_the_definition(seed):
+    rows = random_seasons(seed).sample(frac=1.0, random_state=seed)
+    years = sorted(rows["year"].unique())
+    batched = _season_sampling_errors(rows, years)
+    assert batched == {int(y): _season_sampling_error(rows, int(y)) for y in years}
+
+
+def test_a_season_does_not_depend_on_the_others():
+    rows = random_seasons(1)
+    alone = rows[rows["year"] == 2020]
+    assert _season_sampling_errors(rows, [2020])[2020] == _season_sampling_errors(alone, [2020])[2020]
+
+
+def test_years_without_measured_days_are_answered():
+    rows = random_seasons(2, years=[2020])
+    errors = _season_sampling_errors(rows, [2020, 2031])
+    assert errors[2031] == {"observedDays": 0, "standardError": None, "ci95": None}
+
+
+def test_without_frac_raw_the_frac_column_is_measured():
+    rows = random_seasons(3).drop(columns="frac_raw").assign(frac=lambda f: np.linspace(0, 1, len(f)))
+    years = sorted(rows["year"].unique())
+    assert _season_sampling_errors(rows, years) == {
+        int(y): _season_sampling_error(rows, int(y)) for y in years
+    }
+
+
+def test_the_same_values_are_bootstrapped_once(monkeypatch):
+    rows = random_seasons(4)
+    years = sorted(rows["year"].unique())
+    first = _season_sampling_errors(rows, years)
+
+    def no_draws(*args, **kwargs):
+        raise AssertionError("bootstrapped again")
+
+    monkeypatch.setattr(main.np.random, "default_rng", no_draws)
+    # another frame holding the same measured values
+    assert _season_sampling_errors(rows.copy(), years) == first
+
+    changed = rows.copy()
+    changed.loc[changed["frac_raw"].first_valid_index(), "frac_raw"] = 0.123
+    with pytest.raises(AssertionError, match="bootstrapped again"):
+        _season_sampling_errors(changed, years)
+
+
+def test_the_cache_stays_small():
+    for seed in range(main._SAMPLING_ERRORS_KEPT + 5):
+        _season_sampling_errors(random_seasons(seed, years=[2020]), [2020])
+    assert len(main._SAMPLING_ERRORS) == main._SAMPLING_ERRORS_KEPT
@@ -0,0 +1,117 @@
+"""A slow or failing database is answered with the last good payload.
+
+The builds here are stand-ins for _data_payload, so each test decides how long
+a build takes and where its data comes from.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def client(offline, monkeypatch):
+    monkeypatch.setattr(main.settings, "payload_stale_after_seconds", 0.2)
+    monkeypatch.setattr(main.settings, "payload_max_stale_seconds", 3600)
+    with TestClient(main.app) as client:
+        yield client
+
+
+class Builds:
+    """A _data_payload stand-in serving `body`, from `status`, after `delay`."""
+
+    def __init__(self):
+        self.body = b'{"v":1}'
+        self.status = "ok"
+        self.delay = 0.0
+        self.error: Exception | None = None
+        self.finished = threading.Event()
+
+    def __call__(self, fmt, fields):
+        time.sleep(self.delay)
+        try:
+            if self.error is not None:
+                raise self.error
+            source = "database" if self.status == "ok" else "json-fallback"
+            entry = main._store_payload("/data", None, self.body, source=source, fmt=fmt)
+            return main._Served(entry, self.status, None)
+        finally:
+            self.finished.set()
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    builds = Builds()
+    monkeypatch.setattr(main, "_data_payload", builds)
+    return builds
+
+
+def test_a_healthy_database_is_served_fresh(client, builds):
+    response = client.get("/data")
+    assert response.content == b'{"v":1}'
+    assert response.headers["X-Climate-Stale"] == "false"
+    assert response.headers["X-Climate-Data-Age"] == "0"
+
+
+def test_a_slow_rebuild_is_answered_with_the_last_good_payload(client, builds):
+    client.get("/data")
+    builds.body, builds.delay = b'{"v":2}', 1.0
+    builds.finished.clear()
+
+    started = time.perf_counter()
+    response = client.get("/data")
+    assert time.perf_counter() - started < 0.8
+    assert response.content == b'{"v":1}'
+    assert response.headers["X-Climate-Stale"] == "true"
+    assert response.headers["X-Climate-Db-Status"] == "slow"
+
+    # the rebuild carried on in the background and replaced it
+    assert builds.finished.wait(2)
+    builds.delay = 0.0
+    time.sleep(0.05)
+    assert client.get("/data").headers["X-Climate-Stale"] == "false"
+    assert main._LAST_GOOD[("/data", None), "records"].entry.body == b'{"v":2}'
+
+
+@pytest.mark.parametrize("failure", ["fallback", "exception"])
+def test_a_failed_rebuild_keeps_the_last_good_payload(client, builds, failure):
+    client.get("/data")
+    if failure == "fallback":
+        builds.body, builds.status = b'{"from":"file"}', "error"
+    else:
+        builds.error = HTTPException(status_code=500, detail="boom")
+    response = client.get("/data")
+    assert response.status_code == 200
+    assert response.content == b'{"v":1}'
+    assert response.headers["X-Climate-Stale"] == "true"
+    assert response.headers["X-Climate-Db-Status"] == "error"
+
+
+def test_too_old_a_payload_is_not_served(client, builds, monkeypatch):
+    client.get("/data")
+    builds.body, builds.status = b'{"from":"file"}', "error"
+    monkeypatch.setattr(main.settings, "payload_max_stale_seconds", 0)
+    time.sleep(0.01)
+    response = client.get("/data")
+    assert response.content == b'{"from":"file"}'
+    assert response.headers["X-Climate-Stale"] == "false"
+
+
+def test_without_a_last_good_payload_the_request_waits(client, builds):
+    builds.delay = 0.5
+    response = client.get("/data")
+    assert response.content == b'{"v":1}'
+    assert response.headers["X-Climate-Stale"] == "false"
+
+
+def test_stale_payloads_are_kept_per_format(client, builds):
+    client.get("/data")
+    builds.status = "error"
+    assert client.get("/data", params={"format": "columnar"}).headers["X-Climate-Stale"] == "false"
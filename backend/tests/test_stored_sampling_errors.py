@@ -0,0 +1,162 @@
+"""The pipeline's stored sampling errors are the ones the API would compute.
+
+update_fjord_data.py bootstraps each season once per run and stores the result
+in fjord_mean_fraction and the published payload, stamped. The API serves them
+when the stamp matches and recomputes otherwise, so a stored table has to be
+indistinguishable from a fresh computation.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+
+PIPELINE = Path(__file__).resolve().parents[2] / "data-pipeline"
+sys.path.insert(0, str(PIPELINE))
+
+import update_fjord_data  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    main._SAMPLING_ERRORS.clear()
+    yield
+    main._SAMPLING_ERRORS.clear()
+
+
+@pytest.fixture(scope="module")
+def season_rows():
+    csv_path = main._find_fjord_csv()
+    if csv_path is None:
+        pytest.skip("no fjord CSV in this checkout")
+    rows = main._parse_fjord_csv(csv_path)
+    return rows[(rows["doy"] >= main.FJORD_SUN_START) & (rows["doy"] <= main.FJORD_SUN_END)]
+
+
+def random_seasons(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for year in range(2016, 2027):
+        days = int(rng.integers(0, 80))
+        raw = rng.random(days)
+        raw[rng.random(days) < 0.3] = np.nan
+        frames.append(pd.DataFrame({"year": year, "frac": 0.5, "frac_raw": raw}))
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture
+def stored(sqlite_database, season_rows):
+    """fjord_mean_fraction as the pipeline writes it, in SQLite."""
+    years = sorted(season_rows["year"].unique())
+    errors = update_fjord_data.season_sampling_errors(season_rows, years)
+    table = pd.concat(
+        [
+            pd.DataFrame({"year": years, "mean": 0.5}),
+            update_fjord_data.sampling_error_columns(errors, years),
+        ],
+        axis=1,
+    )
+    table.to_sql("fjord_mean_fraction", sqlite_database, index=False)
+    return sqlite_database, years
+
+
+# --- one definition, two services ---------------------------------------------
+
+
+def test_both_sides_fingerprint_alike():
+    assert update_fjord_data.sampling_error_fingerprint() == main._sampling_error_fingerprint()
+
+
+def test_both_sides_agree_on_the_shipped_record(season_rows):
+    years = sorted(season_rows["year"].unique())
+    assert update_fjord_data.season_sampling_errors(season_rows, years) == main._season_sampling_errors(
+        season_rows, years
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_both_sides_agree_on_random_seasons(seed):
+    rows = random_seasons(seed)
+    years = list(range(2016, 2028))  # 2027 has no days at all
+    assert update_fjord_data.season_sampling_errors(rows, years) == main._season_sampling_errors(rows, years)
+
+
+# --- the API serves what is stored --------------------------------------------
+
+
+def test_the_stored_table_equals_a_fresh_computation(stored, season_rows):
+    engine, years = stored
+    with engine.connect() as conn:
+        assert main._stored_sampling_errors(conn, years) == main._season_sampling_errors(season_rows, years)
+
+
+def test_another_stamp_is_not_served(stored):
+    engine, years = stored
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE fjord_mean_fraction SET sampling_params = 'v0;draws=500'")
+    with engine.connect() as conn:
+        assert main._stored_sampling_errors(conn, years) is None
+
+
+def test_a_table_without_the_columns_is_not_served(sqlite_database):
+    pd.DataFrame({"year": [2020], "mean": [0.5]}).to_sql(
+        "fjord_mean_fraction", sqlite_database, index=False
+    )
+    with sqlite_database.connect() as conn:
+        assert main._stored_sampling_errors(conn, [2020]) is None
+
+
+def test_a_missing_season_is_not_served(stored):
+    engine, years = stored
+    with engine.connect() as conn:
+        assert main._stored_sampling_errors(conn, years + [max(years) + 1]) is None
+
+
+def published(season_rows, stamp):
+    years = sorted(season_rows["year"].unique())
+    errors = update_fjord_data.season_sampling_errors(season_rows, years)
+    return {
+        "spring": [],
+        "season": [],
+        "frac": [{"year": int(y), "mean": 0.5, **errors[int(y)]} for y in years],
+        "samplingErrorParams": stamp,
+        "daily": [
+            {"date": f"{r.year}-01-01", "year": int(r.year), "doy": int(r.doy), "frac": r.frac,
+             "fracRaw": None if pd.isna(r.frac_raw) else float(r.frac_raw)}
+            for r in season_rows.itertuples(index=False)
+        ],
+        "seasonLossPct": None,
+    }
+
+
+def test_a_published_payload_is_served_without_bootstrapping(season_rows, monkeypatch):
+    payload = published(season_rows, main._sampling_error_fingerprint())
+    expected = [dict(row) for row in payload["frac"]]
+    monkeypatch.setattr(main, "_season_sampling_errors", lambda *a: pytest.fail("bootstrapped"))
+    completed = main._complete_published_fjord_payload(payload)
+    assert completed["frac"] == expected
+    assert "samplingErrorParams" not in completed
+
+
+def test_a_published_payload_with_another_stamp_is_recomputed(season_rows):
+    payload = published(season_rows, "v0;draws=500")
+    for row in payload["frac"]:
+        row["standardError"] = -1.0
+    completed = main._complete_published_fjord_payload(payload)
+    years = [row["year"] for row in completed["frac"]]
+    fresh = main._season_sampling_errors(season_rows, years)
+    assert completed["frac"] == [{"year": y, "mean": 0.5, **fresh[y]} for y in years]
+
+
+def test_the_pipeline_module_imports_without_a_database(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("DATABASE_PUBLIC_URL", raising=False)
+    import importlib
+
+    importlib.reload(update_fjord_data)
@@ -7,10 +7,18 @@ and freeze/breakup dates for the Uummannaq Fjord dataset and load them into
 PostgreSQL.
 """
 
+import math
 import os
+from datetime import date, timedelta
+
 import pandas as pd
 from sqlalchemy import create_engine, text
 
+from update_pipeline import payload_version, publish_api_payload
+
+import climate_stats
+from climate_stats import season_sampling_errors
+
 # Constants matching the original front-end logic
 # Mirrors backend/main.py's FJORD_* constants, and it is not decoration that
 # they match: this script writes the tables that /uummannaq serves from the
@@ -46,6 +54,101 @@ def year_groups(years) -> tuple[list[int], list[int]]:
     return early, late
 FJORD_KM2 = 3450
 
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def label_for_doy(doy: int) -> str:
+    """Axis label for a day of year. Mirrors backend/main.py _label_for_doy.
+
+    Pinned to a common year, 2001, so day 180 reads 29-Jun as it does in most
+    seasons rather than the leap year's 28-Jun.
+    """
+    day = date(2001, 1, 1) + timedelta(days=int(doy) - 1)
+    return f"{day.day:02d}-{MONTHS[day.month - 1]}"
+
+
+def _finite_or_none(value):
+    if value is None:
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def season_band(rows, early_yrs, late_yrs) -> pd.DataFrame:
+    """climate_stats.season_band over the sun window, as /uummannaq computes it.
+
+    A (doy, period) without a value is NaN, written as NULL.
+    """
+    return climate_stats.season_band(rows, early_yrs, late_yrs, (SUN_START, SUN_END))
+
+
+def merged_season(records) -> list[dict]:
+    """Pivot the season band to one row per day, as /uummannaq serves it."""
+    by_doy: dict[int, dict[str, dict]] = {}
+    for record in records:
+        by_doy.setdefault(int(record["doy"]), {})[record["period"]] = record
+    merged = []
+    for doy in sorted(by_doy):
+        early = by_doy[doy].get("early") or {}
+        late = by_doy[doy].get("late") or {}
+        merged.append({
+            "day": label_for_doy(doy),
+            "eMean": _finite_or_none(early.get("mean")),
+            "e25": _finite_or_none(early.get("p25")),
+            "e75": _finite_or_none(early.get("p75")),
+            "lMean": _finite_or_none(late.get("mean")),
+            "l25": _finite_or_none(late.get("p25")),
+            "l75": _finite_or_none(late.get("p75")),
+        })
+    return merged
+
+
+def season_loss_pct(merged: list[dict]):
+    """Ratio of the two period MEANS, as backend/main.py computes it."""
+    early_sum = late_sum = 0.0
+    paired = 0
+    for row in merged:
+        if row["eMean"] is not None and row["lMean"] is not None:
+            early_sum += row["eMean"]
+            late_sum += row["lMean"]
+            paired += 1
+    if not paired or early_sum <= 0:
+        return None
+    return round((1 - (late_sum / early_sum)) * 100, 1)
+
+# --- Per season sampling error ------------------------------------------------
+# Both /uummannaq branches bootstrapped a confidence interval for every season
+# on every cache miss. The measured days only change when this script runs, so
+# it computes them here, once, into fjord_mean_fraction and the published
+# payload, stamped with sampling_error_fingerprint(). The API uses them only
+# when that stamp equals its own and computes them itself otherwise, as with
+# the decadal anomaly in update_pipeline.py.
+#
+# season_sampling_errors is climate_stats', the bootstrap the API runs.
+
+
+def sampling_error_fingerprint() -> str:
+    """climate_stats.sampling_error_fingerprint over the sun window."""
+    return climate_stats.sampling_error_fingerprint((SUN_START, SUN_END))
+
+
+def sampling_error_columns(errors: dict, years) -> pd.DataFrame:
+    """`errors` as the fjord_mean_fraction columns, one row per year."""
+    records = []
+    for year in years:
+        error = errors[int(year)]
+        ci95 = error["ci95"] or [None, None]
+        records.append({
+            "observed_days": error["observedDays"],
+            "measured_mean": error.get("measuredMean"),
+            "standard_error": error["standardError"],
+            "ci95_low": ci95[0],
+            "ci95_high": ci95[1],
+            "sampling_params": sampling_error_fingerprint(),
+        })
+    return pd.DataFrame(records)
+
+
 def _database_url() -> str:
     url = os.getenv("DATABASE_URL") or os.getenv("DATABASE_PUBLIC_URL")
     if not url:
@@ -53,8 +156,6 @@ def _database_url() -> str:
     return url
 
 
-engine = create_engine(_database_url())
-
 def create_tables(engine):
     """Create tables if they do not already exist."""
     with engine.begin() as conn:
@@ -87,7 +188,13 @@ def create_tables(engine):
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS fjord_mean_fraction (
                 year integer PRIMARY KEY,
-                mean double precision
+                mean double precision,
+                observed_days integer,
+                measured_mean double precision,
+                standard_error double precision,
+                ci95_low double precision,
+                ci95_high double precision,
+                sampling_params text
             )
         """))
         conn.execute(text("""
@@ -154,6 +261,22 @@ def ensure_schema(engine):
         if "frac_raw" not in cols:
             c.execute(text("ALTER TABLE fjord_daily ADD COLUMN frac_raw double precision"))
 
+        # The per season sampling error, stamped; see season_sampling_errors.
+        cols = {r[0] for r in c.execute(text("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name='fjord_mean_fraction'
+        """)).fetchall()}
+        for column, sql_type in [
+            ("observed_days", "integer"),
+            ("measured_mean", "double precision"),
+            ("standard_error", "double precision"),
+            ("ci95_low", "double precision"),
+            ("ci95_high", "double precision"),
+            ("sampling_params", "text"),
+        ]:
+            if column not in cols:
+                c.execute(text(f"ALTER TABLE fjord_mean_fraction ADD COLUMN {column} {sql_type}"))
+
         # Ensure fjord_daily exists and date is DATE
         c.execute(text("""
             CREATE TABLE IF NOT EXISTS fjord_daily (
@@ -175,8 +298,10 @@ def ensure_schema(engine):
                 ALTER COLUMN date TYPE date USING date::date
             """))
 
-def update_fjord_data():
+def update_fjord_data(engine=None):
     """Compute derived metrics and write them to the database."""
+    if engine is None:
+        engine = create_engine(_database_url())
     csv_path = os.getenv("FJORD_CSV_PATH", "/app/data/summary_test_cleaned.csv")
     rows = pd.read_csv(csv_path, parse_dates=['date'])
     rows.columns = [c.lower() for c in rows.columns]
@@ -209,25 +334,12 @@ def update_fjord_data():
         c.execute(text("TRUNCATE fjord_daily"))
     rows.to_sql('fjord_daily', engine, if_exists='append', index=False, method='multi')
 
-    # helpers
-    mean = lambda s: float(s.mean()) if len(s) else None
-    pct  = lambda s,q: float(s.quantile(q)) if len(s) else None
-
     # 2) fjord_season_band
-    records = []
-    for doy in range(SUN_START, SUN_END + 1):
-        for period, years in [('early', early_yrs), ('late', late_yrs)]:
-            vals = rows.query('year in @years and doy == @doy')['frac']
-            records.append({
-                'doy': doy,
-                'period': period,
-                'mean': mean(vals),
-                'p25': pct(vals, 0.25),
-                'p75': pct(vals, 0.75),
-            })
+    band = season_band(rows, early_yrs, late_yrs)
+    records = band.to_dict('records')
     with engine.begin() as c:
         c.execute(text("TRUNCATE fjord_season_band"))
-    pd.DataFrame(records).to_sql('fjord_season_band', engine, if_exists='append', index=False, method='multi')
+    band.to_sql('fjord_season_band', engine, if_exists='append', index=False, method='multi')
 
     # 3) fjord_spring_anomaly
     spring_means = rows.query('doy >= @SPRING_A and doy <= @SPRING_B').groupby('year')['frac'].mean()
@@ -238,9 +350,16 @@ def update_fjord_data():
         c.execute(text("TRUNCATE fjord_spring_anomaly"))
     spring_anomaly.to_sql('fjord_spring_anomaly', engine, if_exists='append', index=False, method='multi')
 
-    # 4) fjord_mean_fraction
-    mean_fraction = rows.query('doy >= @SUN_START and doy <= @SUN_END').groupby('year')['frac'].mean().round(4).reset_index()
+    # 4) fjord_mean_fraction, with each season's sampling error
+    # in date order, as the API reads fjord_daily: the order of the measured
+    # days is what the seeded resample indices point into
+    season_rows = rows.query('doy >= @SUN_START and doy <= @SUN_END').sort_values('date')
+    mean_fraction = season_rows.groupby('year')['frac'].mean().round(4).reset_index()
     mean_fraction.columns = ['year', 'mean']
+    sampling_errors = season_sampling_errors(season_rows, mean_fraction['year'])
+    mean_fraction = pd.concat(
+        [mean_fraction, sampling_error_columns(sampling_errors, mean_fraction['year'])], axis=1
+    )
     with engine.begin() as c:
         c.execute(text("TRUNCATE fjord_mean_fraction"))
     mean_fraction.to_sql('fjord_mean_fraction', engine, if_exists='append', index=False, method='multi')
@@ -256,11 +375,45 @@ def update_fjord_data():
         c.execute(text("TRUNCATE fjord_freeze_breakup"))
     pd.DataFrame(fb_records).to_sql('fjord_freeze_breakup', engine, if_exists='append', index=False, method='multi')
 
+    # 6) the prebuilt /uummannaq payload, read by the API as a single row.
+    # Freeze-up and break-up are deliberately not in it: they have one
+    # definition, backend/main.py _freeze_and_breakup_all, and the API attaches
+    # them from `daily` below. The sampling error travels stamped, like the
+    # table's; the API recomputes it from `daily` when the stamp differs.
+    merged = merged_season(records)
+    daily = [
+        {
+            'date': row.date.isoformat(),
+            'year': int(row.year),
+            'doy': int(row.doy),
+            'frac': _finite_or_none(row.frac),
+            'fracRaw': _finite_or_none(row.frac_raw),
+        }
+        for row in rows.sort_values('date').itertuples(index=False)
+    ]
+    payload = {
+        'spring': [
+            {'year': int(r.year), 'anomaly': _finite_or_none(r.anomaly)}
+            for r in spring_anomaly.itertuples(index=False)
+        ],
+        'season': merged,
+        'frac': [
+            {'year': int(r.year), 'mean': _finite_or_none(r.mean), **sampling_errors[int(r.year)]}
+            for r in mean_fraction.itertuples(index=False)
+        ],
+        'samplingErrorParams': sampling_error_fingerprint(),
+        'daily': daily,
+        'seasonLossPct': season_loss_pct(merged),
+    }
+    version = payload_version(payload)
+    publish_api_payload(engine, '/uummannaq', 'uummannaq', version, payload)
+
 def ensure_tables(engine):
     """Ensure tables exist even in hosted environments where __main__ isn't run."""
     create_tables(engine)
 
 
 if __name__ == '__main__':
+    engine = create_engine(_database_url())
     ensure_tables(engine)
-    update_fjord_data()
+    update_fjord_data(engine)
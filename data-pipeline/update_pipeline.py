@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
+import gzip
+import hashlib
 import json
+import math
 import os
 import subprocess
 import sys
@@ -11,7 +14,11 @@ import requests
 import io
 
 # For inserting into Postgres
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+
+# The computations this pipeline precomputes for the API, the same code the API
+# runs: climate_stats.py is a copy of backend/climate_stats.py.
+from climate_stats import compute_decadal_daily_anomaly, decadal_anomaly_fingerprint
 
 # ===========================================================================
 # Shared source registry, HTTP fetching and freshness assertions
@@ -30,7 +37,7 @@ from sqlalchemy import create_engine
 # The helpers are kept inside update_pipeline.py rather than in a separate
 # sibling module on purpose: data-pipeline/Dockerfile copies an explicit
 # allowlist of files into the Railway image
-#     COPY update_pipeline.py update_fjord_data.py wait_for_db.py ./
+#     COPY update_pipeline.py update_fjord_data.py wait_for_db.py climate_stats.py ./
 # so a new sibling module would simply be absent at runtime there and the cron
 # job would crash on import.  If that COPY line ever becomes a wildcard, this
 # block can be lifted into its own module unchanged.
@@ -438,6 +445,189 @@ def latest_year_in(frame: pd.DataFrame, label: str) -> int:
     return int(years.max())
 
 
+def payload_version(payload: dict) -> str:
+    """Content hash of the published payload.
+
+    The API caches its /data response per version, so the version has to
+    change exactly when the data does. Hashing the content rather than stamping
+    the run time means a rerun that fetched identical numbers keeps every
+    client's cached copy and ETag valid.
+    """
+    canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def index_daily_sea_ice(engine) -> None:
+    """Index daily_sea_ice on (Year, DayOfYear) for /data/daily range queries.
+
+    to_sql(if_exists="replace") drops the table with its indexes, so this runs
+    after every write rather than once.
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS daily_sea_ice_year_doy '
+            'ON daily_sea_ice ("Year", "DayOfYear")'
+        ))
+
+
+def write_data_version(conn, dataset: str, version: str) -> None:
+    """Record, inside the caller's transaction, that `dataset` now holds `version`.
+
+    Written last, after every table of the run, so the API never sees the new
+    version next to old rows. backend/main.py reads this to decide whether its
+    cached payload is still current. publish_api_payload writes it.
+    """
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            dataset text PRIMARY KEY,
+            version text NOT NULL,
+            published_at timestamptz NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(
+        text("""
+            INSERT INTO data_version (dataset, version, published_at)
+            VALUES (:dataset, :version, now())
+            ON CONFLICT (dataset) DO UPDATE
+            SET version = EXCLUDED.version, published_at = EXCLUDED.published_at
+        """),
+        {"dataset": dataset, "version": version},
+    )
+
+
+# --- Prebuilt API payloads --------------------------------------------------
+# The API used to assemble /data from six SELECT * reads and /uummannaq from
+# four, on every cache miss. The pipeline already holds every one of those
+# frames in memory at the end of a run, so it writes the finished payload as a
+# single api_payload row, keyed by route and version, plain and gzipped. The API
+# reads that one row and only attaches what has to be computed at request time:
+# the freshness block, whose ages are relative to today.
+#
+# Mirrors backend/main.py _ANNUAL_KEEP and _DAILY_DROP. The annual frame carries
+# the whole OWID entity table, 268 columns, of which the story reads nine.
+API_ANNUAL_KEEP = {
+    "Year", "Glob", "64N-90N", "GlobalCO2Mean", "SeaIceMean",
+    "Arctic_z", "GlobCO2Mean_z", "SeaIce_z", "SeaIce_z_inv",
+}
+API_DAILY_DROP = {"Month", "Day", "DateStr"}
+
+
+def slim_data_payload(payload: dict) -> dict:
+    """The /data sections the API serves, with the columns it serves."""
+    return {
+        "annual": [
+            {k: v for k, v in row.items() if k in API_ANNUAL_KEEP}
+            for row in payload["annual"]
+        ],
+        "dailySeaIce": [
+            {k: v for k, v in row.items() if k not in API_DAILY_DROP}
+            for row in payload["dailySeaIce"]
+        ],
+        "annualAnomaly": payload["annualAnomaly"],
+        "corrMatrix": payload["corrMatrix"],
+        "iqrStats": payload["iqrStats"],
+        "partial2025": payload["partial2025"],
+    }
+
+
+def _json_safe(value):
+    """NaN and infinities become null, numpy scalars and dates plain values."""
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def serialize_payload(payload: dict) -> bytes:
+    """Compact, strict JSON, the form the API parses and re-serves."""
+    return json.dumps(
+        _json_safe(payload), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def publish_api_payload(engine, route: str, dataset: str, version: str, payload: dict) -> None:
+    """Store the finished payload for `route` and publish `version` of `dataset`.
+
+    The payload row, the data_version row and the removal of older payload
+    rows commit together. The API looks the row up by the version it reads in
+    data_version, so it never sees a version without its row, nor finds the
+    row of the version it still reads gone. It is the last write of a run.
+    """
+    body = serialize_payload(payload)
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS api_payload (
+                route text NOT NULL,
+                version text NOT NULL,
+                body text NOT NULL,
+                body_gzip bytea,
+                created_at timestamptz NOT NULL DEFAULT now(),
+                PRIMARY KEY (route, version)
+            )
+        """))
+        conn.execute(
+            text("""
+                INSERT INTO api_payload (route, version, body, body_gzip, created_at)
+                VALUES (:route, :version, :body, :body_gzip, now())
+                ON CONFLICT (route, version) DO UPDATE
+                SET body = EXCLUDED.body,
+                    body_gzip = EXCLUDED.body_gzip,
+                    created_at = EXCLUDED.created_at
+            """),
+            {
+                "route": route,
+                "version": version,
+                "body": body.decode("utf-8"),
+                "body_gzip": gzip.compress(body, mtime=0),
+            },
+        )
+        write_data_version(conn, dataset, version)
+        conn.execute(
+            text("DELETE FROM api_payload WHERE route = :route AND version <> :version"),
+            {"route": route, "version": version},
+        )
+    print(f"[INFO] Published {route} payload {version}: {len(body)} bytes.")
+
+
+# --- Decadal daily anomaly ----------------------------------------------------
+# The decadal anomaly chart used to be computed by the API from dailySeaIce on
+# every cache miss. It only changes when the daily series does, so the run
+# computes it once and writes it to decadal_anomaly, and into the published
+# /data payload.
+#
+# The SEAICE_* variables are the ones backend/settings.py reads, with the same
+# defaults. The two services are configured separately, so every row carries
+# the fingerprint of the parameters it was computed with, and the API uses the
+# table only when that fingerprint equals its own. Otherwise it computes the
+# anomaly itself, as before.
+#
+# The computation and the fingerprint are climate_stats', the same functions
+# the API runs.
+DECADAL_ANOMALY_SETTINGS = {
+    "yr_min": ("SEAICE_YR_MIN", 1980),
+    "yr_max": ("SEAICE_YR_MAX", 2100),
+    "baseline_start": ("SEAICE_ANOM_BASELINE_START", 1981),
+    "baseline_end": ("SEAICE_ANOM_BASELINE_END", 2010),
+    "smooth_window": ("SEAICE_SMOOTH_WINDOW", 7),
+    "decadal_smooth": ("SEAICE_DECADAL_SMOOTH", 15),
+}
+
+
+def decadal_anomaly_params() -> dict:
+    """The seaice_* settings, read from the environment at call time."""
+    return {
+        name: env_int(env_var, fallback)
+        for name, (env_var, fallback) in DECADAL_ANOMALY_SETTINGS.items()
+    }
+
+
 def update_data():
     """
     Download and process climate datasets to produce a unified JSON payload
@@ -729,6 +919,13 @@ def update_data():
         for row in daily_ice_records
     ]
 
+    # ------------------------------------------------------------------
+    # 11b) Decadal daily anomaly, once per run instead of once per API cache
+    # miss. Same parameters the API reads; see DECADAL_ANOMALY_SETTINGS.
+    decadal_params = decadal_anomaly_params()
+    decadal_fingerprint = decadal_anomaly_fingerprint(decadal_params)
+    decadal_records = compute_decadal_daily_anomaly(daily_ice_records, decadal_params)
+
     # ------------------------------------------------------------------
     # 12) Convert final DataFrames to Python dicts for JSON
     merged_all = merged_all.replace({np.nan: None})
@@ -762,6 +959,7 @@ def update_data():
     iqr_df = pd.DataFrame(iqr_stats_list)
     p2025_df = pd.DataFrame(partial_2025_list)
     anomaly_df = pd.DataFrame(annual_anomaly_list)
+    decadal_df = pd.DataFrame(decadal_records).assign(params=decadal_fingerprint)
 
     # Create directories if not present
     os.makedirs("data/csv", exist_ok=True)
@@ -773,6 +971,7 @@ def update_data():
     iqr_df.to_csv(os.path.join("data/csv", "iqrStats.csv"), index=False)
     p2025_df.to_csv(os.path.join("data/csv", "partial2025.csv"), index=False)
     anomaly_df.to_csv(os.path.join("data/csv", "annualAnomaly.csv"), index=False)
+    decadal_df.to_csv(os.path.join("data/csv", "decadalAnomaly.csv"), index=False)
 
     # Save combined JSON
     with open(os.path.join("data", "data.json"), "w") as f:
@@ -788,13 +987,26 @@ def update_data():
         # camelCase in the API response for the frontend.
         annual_df.to_sql("annual", engine, if_exists="replace", index=False)
         daily_df.to_sql("daily_sea_ice", engine, if_exists="replace", index=False)
+        index_daily_sea_ice(engine)
         corr_df.to_sql("corr_matrix", engine, if_exists="replace", index=False)
         iqr_df.to_sql("iqr_stats", engine, if_exists="replace", index=False)
         p2025_df.to_sql("partial_2025", engine, if_exists="replace", index=False)
         anomaly_df.to_sql(
             "annual_anomaly", engine, if_exists="replace", index=False
         )
-        print("[INFO] Successfully inserted data into Postgres.")
+        decadal_df.to_sql(
+            "decadal_anomaly", engine, if_exists="replace", index=False
+        )
+        # The fingerprint goes into the version too: new parameters over the
+        # same daily data still change what /data serves.
+        version = payload_version(
+            {**final_output, "decadalAnomalyParams": decadal_fingerprint}
+        )
+        published = slim_data_payload(final_output)
+        published["decadalAnomaly"] = decadal_records
+        published["decadalAnomalyParams"] = decadal_fingerprint
+        publish_api_payload(engine, "/data", "data", version, published)
+        print(f"[INFO] Successfully inserted data into Postgres (version {version}).")
     else:
         print("[INFO] No DATABASE_URL / DATABASE_PUBLIC_URL found, skipping Postgres insert.")
 
@@ -67,6 +67,8 @@ export interface FjordDataBundle {
   freeze: FjordFreezeBreakup[];
   daily: FjordDailyRow[];
   seasonLossPct?: number | null;
+  /** Days in the daily series when `?max_points` thinned it. */
+  dailyDownsampledFrom?: number | null;
   meta?: FjordDataMeta | null;
 }
 